@@ -4,72 +4,202 @@ Only applies when running on Render (production environment)
 """
 
 import os
+import hmac
+import asyncio
+import time
+import hashlib
 import secrets
-from datetime import datetime, timedelta
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import HTTPException, status, Depends, Request
-from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, VerificationError, InvalidHashError
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import PyJWTError as JWTError
 from sqlalchemy.orm import Session
 from .database import get_db
-from . import models
-from .config import is_render
+from .config import system_config
+
+logger = logging.getLogger(__name__)
 
 # Security configuration
-SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
+# Without SECRET_KEY (local and mirror hosts), tokens are signed with a key
+# generated once and kept in DOOR_JWT_KEY_FILE, by default data/door-jwt-key
+# in the repository, so sessions survive restarts on the same host
+_SECRET_KEY_FILE = Path(os.getenv(
+    "DOOR_JWT_KEY_FILE", Path(__file__).resolve().parent.parent / "data" / "door-jwt-key"
+))
+
+def _read_secret_key_file() -> Optional[str]:
+    """
+    Read the shared key file, trusting it only if this user owns it and no
+    one else can read or write it
+    """
+    try:
+        fd = os.open(_SECRET_KEY_FILE, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    with os.fdopen(fd) as f:
+        st = os.fstat(f.fileno())
+        if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+            logger.error("Ignoring JWT key file %s: not owned by this user or accessible to others", _SECRET_KEY_FILE)
+            return None
+        return f.read().strip() or None
+
+def _load_or_create_secret_key() -> str:
+    """Reuse a generated signing key across worker restarts on the same host"""
+    key = _read_secret_key_file()
+    if key:
+        return key
+    
+    key = secrets.token_urlsafe(32)
+    try:
+        _SECRET_KEY_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # O_EXCL so concurrently starting workers agree on a single key
+        fd = os.open(_SECRET_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(key)
+    except FileExistsError:
+        # Another worker won the race, or an untrusted file is in the way
+        # (then this process keeps its own key)
+        return _read_secret_key_file() or key
+    except OSError:
+        pass
+    return key
+
+# Render's filesystem does not survive a redeploy and each instance would sign
+# with its own key, so production refuses to start without SECRET_KEY
+if system_config.is_render and not os.getenv("SECRET_KEY"):
+    raise RuntimeError("SECRET_KEY must be set on Render")
+# `or` short-circuits, so no entropy is drawn when SECRET_KEY is set
+SECRET_KEY = os.getenv("SECRET_KEY") or _load_or_create_secret_key()
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Real tokens are a few hundred bytes; anything bigger is rejected before hashing
+MAX_TOKEN_LENGTH = 4096
+_DEFAULT_TTL = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+_DEFAULT_TTL_SEC = int(_DEFAULT_TTL.total_seconds())
 
 # Password hashing
+# argon2id parameters tuned to roughly 250ms per hash on Render instances
+ph = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+# Legacy bcrypt context, only used to verify hashes created before argon2
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Password verification runs in a small dedicated pool so it never blocks the
+# event loop; the semaphore bounds queued work so a login flood gets 503s
+# instead of an ever-growing backlog
+_HASH_WORKERS = max(2, (os.cpu_count() or 2) // 2)
+_HASH_POOL = ThreadPoolExecutor(max_workers=_HASH_WORKERS, thread_name_prefix="door-hash")
+_HASH_SLOTS = asyncio.Semaphore(_HASH_WORKERS * 2)
+_HASH_SLOT_TIMEOUT = 0.05  # seconds to wait for a free slot before rejecting
+
 # Token scheme
 security = HTTPBearer()
 
+# Verified JWT payloads, keyed by a 16-byte BLAKE2b digest of the token.
+# Entries never outlive the token itself: the TTL matches the default token
+# lifetime and each hit re-checks the payload's own `exp` claim.
+_jwt_cache = TTLCache(maxsize=10_000, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+_jwt_cache_lock = threading.Lock()
+
 def is_production_environment() -> bool:
     """Check if running in production (Render) environment"""
-    return is_render()
+    return system_config.is_render
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash (argon2id, or legacy bcrypt)"""
+    if hashed_password.startswith("$2"):
+        return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return ph.verify(hashed_password, plain_password)
+    except (VerifyMismatchError, VerificationError, InvalidHashError):
+        return False
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    return pwd_context.hash(password)
+    return ph.hash(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the hashing pool without blocking the event loop"""
+    try:
+        await asyncio.wait_for(_HASH_SLOTS.acquire(), timeout=_HASH_SLOT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HASH_POOL, verify_password, plain_password, hashed_password)
+    finally:
+        _HASH_SLOTS.release()
+
+# Admin credentials, hashed once at import so logins never touch os.environ
+# or compare plaintext
+_ADMIN_USER = os.getenv("ADMIN_USERNAME", "admin")
+_VALID_USERS: frozenset = frozenset({_ADMIN_USER})
+_ADMIN_HASH = get_password_hash(os.getenv("ADMIN_PASSWORD")) if os.getenv("ADMIN_PASSWORD") else None
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Create a JWT access token"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
+    """Create a JWT access token from a copy of ``data`` plus iat/exp claims"""
+    # JWT NumericDate is integer epoch seconds - no datetime allocation needed
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_TTL_SEC
+    to_encode = {**data, "iat": now, "exp": now + ttl}
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
-    """Verify and decode a JWT token"""
+    """Verify and decode a JWT token (successful verifications are cached)"""
+    raw = token.encode()
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(key)
+    if cached is not None:
+        cached_token, payload, exp = cached
+        # Guard against digest collisions before trusting the cached payload
+        if hmac.compare_digest(cached_token, raw) and exp > time.time():
+            return payload
+        # Expired (or colliding) entry - drop it and fall through to a full decode
+        with _jwt_cache_lock:
+            _jwt_cache.pop(key, None)
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return payload
+        # Missing exp/sub claims are rejected by the validator itself
+        payload = jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM], options={"require": ["exp", "sub"]}
+        )
     except JWTError:
+        # Invalid tokens are never cached
         return None
+    
+    with _jwt_cache_lock:
+        _jwt_cache[key] = (raw, payload, payload["exp"])
+    return payload
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
     """Get current authenticated user"""
-    if not is_production_environment():
+    if not system_config.is_render:
         # Skip authentication in development
         return {"username": "dev_user", "is_authenticated": True}
     
     token = credentials.credentials
+    if len(token) > MAX_TOKEN_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     payload = verify_token(token)
     
     if payload is None:
@@ -87,9 +217,9 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # For now, we'll use a simple hardcoded user
+    # For now, only the configured admin user is valid
     # In a real application, you'd check against a users table
-    if username != "admin":
+    if username not in _VALID_USERS:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user",
@@ -98,44 +228,38 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     
     return {"username": username, "is_authenticated": True}
 
-def authenticate_user(username: str, password: str) -> bool:
+async def authenticate_user(username: str, password: str) -> bool:
     """Authenticate a user with username and password"""
-    if not is_production_environment():
+    if not system_config.is_render:
         # Skip authentication in development
         return True
     
-    # Hardcoded credentials for production
-    # In a real application, you'd check against a users table
-    correct_username = "admin"
-    correct_password = os.getenv("ADMIN_PASSWORD")
-    
-    # Security: Require AUTH_PASSWORD to be set in environment
-    if not correct_username or not correct_password:
+    # Security: Require ADMIN_PASSWORD to be set in environment
+    if _ADMIN_HASH is None:
         return False
     
-    # Verify password
-    if username == correct_username and password == correct_password:
-        return True
-    return False
+    # Always run both checks so timing does not reveal which field was wrong
+    username_ok = hmac.compare_digest(username.encode(), _ADMIN_USER.encode())
+    password_ok = await verify_password_async(password, _ADMIN_HASH)
+    return username_ok and password_ok
 
 def create_login_token(username: str) -> str:
     """Create a login token for a user"""
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": username}, expires_delta=access_token_expires
+        data={"sub": username}, expires_delta=_DEFAULT_TTL
     )
     return access_token
 
 # Optional: Session-based authentication for HTML pages
 def get_session_user(request: Request) -> Optional[dict]:
     """Get current user from session (for HTML pages)"""
-    if not is_production_environment():
+    if not system_config.is_render:
         # Skip authentication in development
         return {"username": "dev_user", "is_authenticated": True}
     
     # Check for session token
     session_token = request.session.get("access_token")
-    if not session_token:
+    if not session_token or len(session_token) > MAX_TOKEN_LENGTH:
         return None
     
     payload = verify_token(session_token)
@@ -150,7 +274,7 @@ def get_session_user(request: Request) -> Optional[dict]:
 
 def require_auth(request: Request):
     """Require authentication for HTML pages"""
-    if not is_production_environment():
+    if not system_config.is_render:
         # Skip authentication in development
         return {"username": "dev_user", "is_authenticated": True}
     
@@ -160,3 +284,11 @@ def require_auth(request: Request):
         # Return None to indicate authentication failed
         return None
     return user
+
+def warm_up_auth():
+    """Load the password hashing and JWT signing backends before the first request"""
+    # Hashing ADMIN_PASSWORD at import has already warmed argon2 when it is set
+    if _ADMIN_HASH is None:
+        ph.hash("warmup")
+    warm_token = create_access_token({"sub": "warmup"}, expires_delta=timedelta(seconds=60))
+    jwt.decode(warm_token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -8,9 +8,11 @@ Supports three deployment environments:
 
 import os
 import sys
+import functools
 import socket
 from enum import Enum
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from pathlib import Path
 
 class EnvironmentType(Enum):
@@ -20,187 +22,231 @@ class EnvironmentType(Enum):
     RENDER = "render"    # Cloud production - stable, authenticated access
     UNKNOWN = "unknown"  # Fallback
 
+@functools.lru_cache(maxsize=1)
+def _detect() -> EnvironmentType:
+    """
+    Detect the current running environment with priority order:
+    1. Hostname check (mirror = MIRROR)
+    2. Render platform indicators (RENDER)
+    3. Default to LOCAL
+    """
+    
+    env = os.environ
+    
+    # Priority 1: Check hostname for mirror server (the only probe that can raise)
+    try:
+        hostname = socket.gethostname().lower()
+    except Exception:
+        hostname = ""
+    if 'mirror' in hostname:
+        return EnvironmentType.MIRROR
+    
+    # Priority 2: Check for Render environment variables
+    if env.get('RENDER'):
+        return EnvironmentType.RENDER
+    if env.get('USE_NEON', 'False').lower() == 'true':
+        return EnvironmentType.RENDER
+    
+    # Priority 3: Check for Neon database (Render indicator)
+    if env.get('NEON_HOST') and env.get('NEON_DATABASE_NAME'):
+        return EnvironmentType.RENDER
+    
+    # Priority 4: Running file detection
+    main_file = sys.argv[0] if sys.argv else ""
+    if 'main_render.py' in main_file:
+        return EnvironmentType.RENDER
+    
+    # Priority 5: Port detection
+    port_str = env.get('PORT', '8000')
+    port = int(port_str) if port_str.isdigit() else 0
+    if port == 10000:  # Render's default port
+        return EnvironmentType.RENDER
+    
+    # Priority 6: File system paths (Render specific, covers /opt/render)
+    if 'render' in os.getcwd().lower():
+        return EnvironmentType.RENDER
+    
+    # Default: Assume LOCAL development environment
+    return EnvironmentType.LOCAL
+
+def _build_config(environment: EnvironmentType) -> Dict[str, Any]:
+    """Build the configuration dict for an environment"""
+    
+    if environment == EnvironmentType.RENDER:
+        # RENDER: Cloud production - secure, authenticated, external access
+        return {
+            'name': 'Render Production',
+            'description': 'Cloud deployment on Render platform - accessible from anywhere',
+            'database': 'Neon PostgreSQL (Cloud)',
+            'database_type': 'neon',
+            'port': int(os.getenv('PORT', '10000')),
+            'host': '0.0.0.0',
+            'authentication_required': True,
+            'debug': False,
+            'auto_reload': False,
+            'features': {
+                # Security features
+                'authentication': True,           # ALL pages require login
+                'session_management': True,
+                'ssl_enabled': True,
+                'cors_restricted': True,
+                
+                # Database features
+                'database_sync': False,           # No sync to local
+                'database_backup': True,
+                
+                # Application features
+                'external_apis': True,
+                'advanced_logging': True,
+                'production_monitoring': True,
+                'error_tracking': True,
+                
+                # Development features
+                'debug_toolbar': False,
+                'hot_reload': False,
+            },
+            'restrictions': {
+                'file_uploads': 'Limited (10MB)',
+                'local_file_access': 'Restricted',
+                'debug_mode': 'Disabled',
+                'experimental_features': 'Disabled'
+            },
+            'access': 'Public Internet (Authenticated)'
+        }
+        
+    elif environment == EnvironmentType.MIRROR:
+        # MIRROR: Internal production - stable, full features, no auth
+        return {
+            'name': 'Mirror Production',
+            'description': 'Internal production server - stable build with full features',
+            'database': 'PostgreSQL (Docker Container)',
+            'database_type': 'postgres_docker',
+            'port': int(os.getenv('PORT', '8080')),
+            'host': '0.0.0.0',
+            'authentication_required': False,
+            'debug': False,
+            'auto_reload': False,
+            'features': {
+                # Security features (internal network, no auth needed)
+                'authentication': False,          # No login required (trusted network)
+                'session_management': False,
+                'ssl_enabled': False,             # Internal HTTPS via reverse proxy
+                'cors_restricted': False,
+                
+                # Database features
+                'database_sync': True,            # Sync with local dev
+                'database_backup': True,
+                
+                # Application features
+                'external_apis': True,
+                'advanced_logging': True,
+                'production_monitoring': True,
+                'error_tracking': True,
+                
+                # Development features
+                'debug_toolbar': False,
+                'hot_reload': False,
+            },
+            'restrictions': {
+                'file_uploads': 'Unlimited',
+                'local_file_access': 'Full',
+                'debug_mode': 'Disabled',
+                'experimental_features': 'Disabled'
+            },
+            'access': 'Internal Network Only'
+        }
+        
+    else:  # LOCAL
+        # LOCAL: Development - unstable, testing, full access
+        return {
+            'name': 'Local Development',
+            'description': 'Local development machine - testing and unstable features',
+            'database': 'PostgreSQL (Local)',
+            'database_type': 'postgres_local',
+            'port': int(os.getenv('PORT', '8080')),
+            'host': '0.0.0.0',
+            'authentication_required': False,
+            'debug': True,
+            'auto_reload': True,
+            'features': {
+                # Security features (dev mode, no restrictions)
+                'authentication': False,          # No login needed for dev
+                'session_management': False,
+                'ssl_enabled': False,
+                'cors_restricted': False,
+                
+                # Database features
+                'database_sync': True,            # Sync with mirror
+                'database_backup': False,
+                
+                # Application features
+                'external_apis': True,
+                'advanced_logging': True,
+                'production_monitoring': False,
+                'error_tracking': False,
+                
+                # Development features
+                'debug_toolbar': True,
+                'hot_reload': True,
+            },
+            'restrictions': {
+                'file_uploads': 'Unlimited',
+                'local_file_access': 'Full',
+                'debug_mode': 'Enabled',
+                'experimental_features': 'Enabled'
+            },
+            'access': 'Local Network'
+        }
+
+def _freeze(config: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a config dict (and nested dicts) in read-only MappingProxyType views"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+def _thaw(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a frozen config back into plain dicts (for JSON serialization)"""
+    return {
+        key: _thaw(value) if isinstance(value, Mapping) else value
+        for key, value in config.items()
+    }
+
+# Immutable configuration per environment, built once at import and shared
+# by every SystemConfig instance
+_RENDER_CONFIG = _freeze(_build_config(EnvironmentType.RENDER))
+_MIRROR_CONFIG = _freeze(_build_config(EnvironmentType.MIRROR))
+_LOCAL_CONFIG = _freeze(_build_config(EnvironmentType.LOCAL))
+
+_CONFIG_BY_ENV: Dict[EnvironmentType, Mapping[str, Any]] = {
+    EnvironmentType.RENDER: _RENDER_CONFIG,
+    EnvironmentType.MIRROR: _MIRROR_CONFIG,
+    EnvironmentType.LOCAL: _LOCAL_CONFIG,
+    EnvironmentType.UNKNOWN: _LOCAL_CONFIG,  # Same fallback as _build_config
+}
+
 class SystemConfig:
     """Global system configuration and environment detection"""
     
     def __init__(self):
         self._environment = self._detect_environment()
         self._config = self._load_config()
+        
+        # Environment flags are fixed for the life of the process, so they are
+        # plain attributes rather than properties re-evaluated on every call
+        self.is_local: bool = self._environment == EnvironmentType.LOCAL
+        self.is_mirror: bool = self._environment == EnvironmentType.MIRROR
+        self.is_render: bool = self._environment == EnvironmentType.RENDER
+        self.is_production: bool = self.is_mirror or self.is_render
+        self.requires_auth: bool = self._config.get('authentication_required', False)
     
     def _detect_environment(self) -> EnvironmentType:
-        """
-        Detect the current running environment with priority order:
-        1. Hostname check (mirror = MIRROR)
-        2. Render platform indicators (RENDER)
-        3. Default to LOCAL
-        """
-        
-        # Priority 1: Check hostname for mirror server
-        try:
-            hostname = socket.gethostname().lower()
-            if 'mirror' in hostname:
-                return EnvironmentType.MIRROR
-        except Exception:
-            pass
-        
-        # Priority 2: Check for Render environment variables
-        if os.getenv('RENDER'):
-            return EnvironmentType.RENDER
-        if os.getenv('USE_NEON', 'False').lower() == 'true':
-            return EnvironmentType.RENDER
-        
-        # Priority 3: Check for Neon database (Render indicator)
-        if os.getenv('NEON_HOST') and os.getenv('NEON_DATABASE_NAME'):
-            return EnvironmentType.RENDER
-        
-        # Priority 4: Running file detection
-        main_file = sys.argv[0] if sys.argv else ""
-        if 'main_render.py' in main_file:
-            return EnvironmentType.RENDER
-        
-        # Priority 5: Port detection
-        try:
-            port = int(os.getenv('PORT', '8000'))
-            if port == 10000:  # Render's default port
-                return EnvironmentType.RENDER
-        except ValueError:
-            pass
-        
-        # Priority 6: File system paths (Render specific)
-        if '/opt/render' in os.getcwd() or 'render' in os.getcwd().lower():
-            return EnvironmentType.RENDER
-        
-        # Default: Assume LOCAL development environment
-        return EnvironmentType.LOCAL
+        """Detect the current running environment (probed once per process)"""
+        return _detect()
     
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> Mapping[str, Any]:
         """Load configuration based on detected environment"""
-        
-        if self._environment == EnvironmentType.RENDER:
-            # RENDER: Cloud production - secure, authenticated, external access
-            return {
-                'name': 'Render Production',
-                'description': 'Cloud deployment on Render platform - accessible from anywhere',
-                'database': 'Neon PostgreSQL (Cloud)',
-                'database_type': 'neon',
-                'port': int(os.getenv('PORT', '10000')),
-                'host': '0.0.0.0',
-                'authentication_required': True,
-                'debug': False,
-                'auto_reload': False,
-                'features': {
-                    # Security features
-                    'authentication': True,           # ALL pages require login
-                    'session_management': True,
-                    'ssl_enabled': True,
-                    'cors_restricted': True,
-                    
-                    # Database features
-                    'database_sync': False,           # No sync to local
-                    'database_backup': True,
-                    
-                    # Application features
-                    'external_apis': True,
-                    'advanced_logging': True,
-                    'production_monitoring': True,
-                    'error_tracking': True,
-                    
-                    # Development features
-                    'debug_toolbar': False,
-                    'hot_reload': False,
-                },
-                'restrictions': {
-                    'file_uploads': 'Limited (10MB)',
-                    'local_file_access': 'Restricted',
-                    'debug_mode': 'Disabled',
-                    'experimental_features': 'Disabled'
-                },
-                'access': 'Public Internet (Authenticated)'
-            }
-            
-        elif self._environment == EnvironmentType.MIRROR:
-            # MIRROR: Internal production - stable, full features, no auth
-            return {
-                'name': 'Mirror Production',
-                'description': 'Internal production server - stable build with full features',
-                'database': 'PostgreSQL (Docker Container)',
-                'database_type': 'postgres_docker',
-                'port': int(os.getenv('PORT', '8080')),
-                'host': '0.0.0.0',
-                'authentication_required': False,
-                'debug': False,
-                'auto_reload': False,
-                'features': {
-                    # Security features (internal network, no auth needed)
-                    'authentication': False,          # No login required (trusted network)
-                    'session_management': False,
-                    'ssl_enabled': False,             # Internal HTTPS via reverse proxy
-                    'cors_restricted': False,
-                    
-                    # Database features
-                    'database_sync': True,            # Sync with local dev
-                    'database_backup': True,
-                    
-                    # Application features
-                    'external_apis': True,
-                    'advanced_logging': True,
-                    'production_monitoring': True,
-                    'error_tracking': True,
-                    
-                    # Development features
-                    'debug_toolbar': False,
-                    'hot_reload': False,
-                },
-                'restrictions': {
-                    'file_uploads': 'Unlimited',
-                    'local_file_access': 'Full',
-                    'debug_mode': 'Disabled',
-                    'experimental_features': 'Disabled'
-                },
-                'access': 'Internal Network Only'
-            }
-            
-        else:  # LOCAL
-            # LOCAL: Development - unstable, testing, full access
-            return {
-                'name': 'Local Development',
-                'description': 'Local development machine - testing and unstable features',
-                'database': 'PostgreSQL (Local)',
-                'database_type': 'postgres_local',
-                'port': int(os.getenv('PORT', '8080')),
-                'host': '0.0.0.0',
-                'authentication_required': False,
-                'debug': True,
-                'auto_reload': True,
-                'features': {
-                    # Security features (dev mode, no restrictions)
-                    'authentication': False,          # No login needed for dev
-                    'session_management': False,
-                    'ssl_enabled': False,
-                    'cors_restricted': False,
-                    
-                    # Database features
-                    'database_sync': True,            # Sync with mirror
-                    'database_backup': False,
-                    
-                    # Application features
-                    'external_apis': True,
-                    'advanced_logging': True,
-                    'production_monitoring': False,
-                    'error_tracking': False,
-                    
-                    # Development features
-                    'debug_toolbar': True,
-                    'hot_reload': True,
-                },
-                'restrictions': {
-                    'file_uploads': 'Unlimited',
-                    'local_file_access': 'Full',
-                    'debug_mode': 'Enabled',
-                    'experimental_features': 'Enabled'
-                },
-                'access': 'Local Network'
-            }
+        return _CONFIG_BY_ENV[self._environment]
     
     @property
     def environment(self) -> EnvironmentType:
@@ -208,33 +254,8 @@ class SystemConfig:
         return self._environment
     
     @property
-    def is_local(self) -> bool:
-        """Check if running on local development machine"""
-        return self._environment == EnvironmentType.LOCAL
-    
-    @property
-    def is_mirror(self) -> bool:
-        """Check if running on internal mirror server"""
-        return self._environment == EnvironmentType.MIRROR
-    
-    @property
-    def is_render(self) -> bool:
-        """Check if running on Render cloud platform"""
-        return self._environment == EnvironmentType.RENDER
-    
-    @property
-    def is_production(self) -> bool:
-        """Check if running in any production environment (Mirror or Render)"""
-        return self._environment in [EnvironmentType.MIRROR, EnvironmentType.RENDER]
-    
-    @property
-    def requires_auth(self) -> bool:
-        """Check if authentication is required"""
-        return self._config.get('authentication_required', False)
-    
-    @property
-    def config(self) -> Dict[str, Any]:
-        """Get the full configuration"""
+    def config(self) -> Mapping[str, Any]:
+        """Get the full configuration (read-only)"""
         return self._config
     
     def get_feature_status(self, feature: str) -> bool:
@@ -256,7 +277,7 @@ class SystemConfig:
             'environment': self._environment.value,
             'environment_name': self._config.get('name'),
             'description': self._config.get('description'),
-            'config': self._config,
+            'config': _thaw(self._config),
             'detection_methods': {
                 'hostname': hostname,
                 'render_env_var': bool(os.getenv('RENDER')),
@@ -309,12 +330,13 @@ def get_feature_status(feature: str) -> bool:
     """Check if a feature is available in current environment"""
     return system_config.get_feature_status(feature)
 
+@functools.lru_cache(maxsize=1)
 def get_environment_info() -> Dict[str, Any]:
-    """Get comprehensive environment information"""
+    """Get comprehensive environment information (built once; do not mutate)"""
     return system_config.get_environment_info()
 
-def get_config() -> Dict[str, Any]:
-    """Get full configuration for current environment"""
+def get_config() -> Mapping[str, Any]:
+    """Get full configuration for current environment (read-only)"""
     return system_config.config
 
 # Print environment info on import for debugging
@@ -4,19 +4,28 @@ Supports three deployment environments with automatic detection
 """
 
 import os
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+import logging
+import time
+import functools
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.engine import URL
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from dotenv import load_dotenv
 from app.config import get_environment_type, EnvironmentType
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (forked workers inherit them, so parse .env once)
+if not os.getenv('DOOR_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['DOOR_DOTENV_LOADED'] = '1'
 
-def get_database_url():
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def get_database_url() -> URL:
     """
     Get database URL based on environment configuration
-    AUTO-DETECTS environment and returns appropriate connection string
+    AUTO-DETECTS environment and returns appropriate connection URL
+    (resolved once per process; URL.create handles special characters in passwords)
     
     LOCAL:  PostgreSQL on localhost (development)
     MIRROR: PostgreSQL in Docker container (internal production)
@@ -44,8 +53,15 @@ def get_database_url():
                 f"Please set these environment variables in Render dashboard."
             )
 
-        db_url = f"postgresql://{neon_user}:{neon_password}@{neon_host}:{neon_port}/{neon_database}"
-        print(f"🔵 Using RENDER database: Neon PostgreSQL at {neon_host}")
+        db_url = URL.create(
+            "postgresql",
+            username=neon_user,
+            password=neon_password,
+            host=neon_host,
+            port=int(neon_port),
+            database=neon_database,
+        )
+        logger.debug("🔵 Using RENDER database: Neon PostgreSQL at %s", neon_host)
         return db_url
         
     elif env == EnvironmentType.MIRROR:
@@ -57,8 +73,15 @@ def get_database_url():
         db_port = os.getenv('MIRROR_DB_PORT', os.getenv('DB_PORT', '5432'))
         db_name = os.getenv('MIRROR_DB_NAME', os.getenv('DB_NAME', 'bdoor_postgres'))
 
-        db_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        print(f"🟢 Using MIRROR database: PostgreSQL (Docker) at {db_host}:{db_port}")
+        db_url = URL.create(
+            "postgresql",
+            username=db_user,
+            password=db_password,
+            host=db_host,
+            port=int(db_port),
+            database=db_name,
+        )
+        logger.debug("🟢 Using MIRROR database: PostgreSQL (Docker) at %s:%s", db_host, db_port)
         return db_url
         
     else:  # LOCAL
@@ -69,27 +92,139 @@ def get_database_url():
         db_port = os.getenv('DB_PORT', '5432')
         db_name = os.getenv('DB_NAME', 'bdoor_postgres')
 
-        db_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        print(f"🟡 Using LOCAL database: PostgreSQL at {db_host}:{db_port}/{db_name}")
+        db_url = URL.create(
+            "postgresql",
+            username=db_user,
+            password=db_password,
+            host=db_host,
+            port=int(db_port),
+            database=db_name,
+        )
+        logger.debug("🟡 Using LOCAL database: PostgreSQL at %s:%s/%s", db_host, db_port, db_name)
         return db_url
 
-# Create database engine
-DATABASE_URL = get_database_url()
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,   # Recycle connections after 1 hour
-)
+def get_connect_args() -> dict:
+    """
+    psycopg2 connection arguments for the current environment
+    TCP keepalives stop Neon (and NAT on the way to it) from silently killing
+    idle pooled connections, which would otherwise cost a full reconnect
+    """
+    use_neon = get_environment_type() == EnvironmentType.RENDER
+    connect_args = {
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+        "sslmode": "require" if use_neon else "prefer",
+        "application_name": "door",
+    }
+    # Neon endpoint routing for clients without SNI support
+    neon_endpoint = os.getenv('NEON_ENDPOINT_ID')
+    if use_neon and neon_endpoint:
+        connect_args["options"] = f"endpoint={neon_endpoint}"
+    return connect_args
+
+def get_pool_options() -> dict:
+    """
+    Connection pool sizing for the current environment
+    Each knob can be overridden with a DB_POOL_* / DB_MAX_OVERFLOW env var
+    """
+    use_neon = get_environment_type() == EnvironmentType.RENDER
+    # Neon caps connections per compute, so stay well under half of it there
+    default_size = '5' if use_neon else '20'
+    # Recycle before Neon's idle timeout kills the connection
+    default_recycle = '300' if use_neon else '1800'
+    return {
+        "pool_size": int(os.getenv('DB_POOL_SIZE', default_size)),
+        "max_overflow": int(os.getenv('DB_MAX_OVERFLOW', '10')),
+        "pool_timeout": int(os.getenv('DB_POOL_TIMEOUT', '30')),
+        "pool_recycle": int(os.getenv('DB_POOL_RECYCLE', default_recycle)),
+        # LIFO keeps reusing the most recently used (warm) connection
+        "pool_use_lifo": True,
+    }
+
+# Database engine is created on first use (or in the app startup hook) so
+# importing this module does no URL resolution or connection work
+engine = None
+
+# Create session factory (bound to the engine by get_engine)
+# expire_on_commit=False avoids re-fetching every attribute after a commit
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Connections checked back in more recently than this are trusted without a ping
+_PING_IF_IDLE_SEC = 60
+
+def _record_checkin(dbapi_connection, connection_record):
+    connection_record.info["checkin_ts"] = time.monotonic()
+
+def _ping_if_stale(dbapi_connection, connection_record, connection_proxy):
+    """Replacement for pool_pre_ping that skips the round trip for recently used connections"""
+    checkin_ts = connection_record.info.get("checkin_ts")
+    if checkin_ts is not None and time.monotonic() - checkin_ts < _PING_IF_IDLE_SEC:
+        return
+    # Ping in autocommit, as the psycopg2 dialect's own do_ping does, so the
+    # connection is not handed out idle in a transaction opened by the SELECT
+    autocommit = dbapi_connection.autocommit
+    try:
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+        dbapi_connection.autocommit = autocommit
+    except Exception:
+        # Tells the pool to discard this connection and retry with a fresh one
+        raise exc.DisconnectionError()
+
+def get_engine():
+    """Create the database engine on first call and bind the session factory to it"""
+    global engine
+    if engine is None:
+        engine = create_engine(
+            get_database_url(),
+            pool_pre_ping=False,  # Stale connections are pinged by _ping_if_stale instead
+            # Batch executemany: multi-row INSERT ... VALUES, execute_batch for UPDATE/DELETE
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
+            # Larger compiled-statement cache so every route's query shapes stay compiled
+            query_cache_size=1200,
+            connect_args=get_connect_args(),
+            **get_pool_options(),
+        )
+        event.listen(engine, "checkin", _record_checkin)
+        event.listen(engine, "checkout", _ping_if_stale)
+        SessionLocal.configure(bind=engine)
+    return engine
+
+def dispose_engine():
+    """Close all pooled connections (called on application shutdown)"""
+    if engine is not None:
+        engine.dispose()
 
 # Create base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 def get_db() -> Session:
     """Dependency to get database session"""
     db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        # Never hand a connection back to the pool idle in a failed transaction
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def get_db_readonly() -> Session:
+    """Dependency to get a read-only database session for GET endpoints"""
+    db = SessionLocal()
+    # Autocommit read-only connection: no transaction BEGIN/COMMIT round trips
+    db.connection(execution_options={"isolation_level": "AUTOCOMMIT", "postgresql_readonly": True})
     try:
         yield db
     finally:
@@ -98,6 +233,7 @@ def get_db() -> Session:
 def test_connection():
     """Test database connection"""
     try:
+        get_engine()
         db = SessionLocal()
         db.execute(text("SELECT 1"))
         db.close()
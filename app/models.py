@@ -3,11 +3,27 @@ SQLAlchemy models for the Door application
 Based on the original Django models
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, ForeignKey, Boolean, Table, Numeric
-from sqlalchemy.orm import relationship
+import logging
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, ForeignKey, Boolean, Table, Numeric, Index, Sequence, event, select, text
+from sqlalchemy.orm import joinedload, relationship, selectinload
 from sqlalchemy.sql import func
-from datetime import datetime, date
-from .database import Base
+from datetime import datetime, date, timezone
+from .database import Base, SessionLocal
+from .config import is_production
+
+logger = logging.getLogger(__name__)
+
+# Large collections nothing renders: raise on accidental lazy loads during
+# development so N+1 patterns surface early, plain lazy loading in production
+_UNUSED_COLLECTION = "select" if is_production() else "raise_on_sql"
+
+# Client-side defaults: the ORM sends the values with the INSERT, so batched
+# inserts need no RETURNING round trip (server_default stays for other clients)
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _today() -> date:
+    return date.today()
 
 # Association tables for many-to-many relationships
 information_tags = Table(
@@ -60,7 +76,7 @@ class Stock(Base):
     status = Column(String(10), default='monitor')
     price = Column(Numeric(10, 2), nullable=True)
     quantity = Column(Numeric(10, 2), nullable=True)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
     
     # Relationships
     transactions = relationship("StockTrans", back_populates="stock")
@@ -79,13 +95,17 @@ class StockAccount(Base):
     balance = Column(Numeric(12, 2), nullable=True)
     
     # Relationships
-    transactions = relationship("StockTrans", back_populates="account")
+    transactions = relationship("StockTrans", back_populates="account", lazy=_UNUSED_COLLECTION)
     
     def __repr__(self):
         return f"<StockAccount(name='{self.name}', company='{self.company}')>"
 
 class StockTrans(Base):
     __tablename__ = "stocks_stocktrans"
+    __table_args__ = (
+        Index("ix_stocktrans_stock_date", "stock_id", "execute_date"),
+        Index("ix_stocktrans_account_date", "account_id", "order_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     stock_id = Column(Integer, ForeignKey("stocks_stock.id"))
@@ -115,7 +135,7 @@ class InfoSource(Base):
     description = Column(Text)
     
     # Relationships
-    informations = relationship("Information", back_populates="source")
+    informations = relationship("Information", back_populates="source", lazy=_UNUSED_COLLECTION)
     source_maps = relationship("InfoSourceMap", back_populates="source")
     
     def __repr__(self):
@@ -151,32 +171,55 @@ class InfoSourceMap(Base):
 
 class Information(Base):
     __tablename__ = "information_information"
+    __table_args__ = (
+        # Covers "recent information by source" listings without a heap visit
+        Index("ix_info_source_date", "source_id", "date", postgresql_include=["title"]),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String(255), unique=True, index=True)
-    date = Column(DateTime(timezone=True), server_default=func.now())
+    date = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
     source_id = Column(Integer, ForeignKey("information_infosource.id"), nullable=True)
     title = Column(String(255))
     content = Column(Text)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
     
     # Relationships
-    source = relationship("InfoSource", back_populates="informations")
-    tags = relationship("InfoTag", secondary=information_tags, back_populates="informations")
+    # Source and tags are rendered for every row of the information list
+    source = relationship("InfoSource", back_populates="informations", lazy="selectin")
+    tags = relationship("InfoTag", secondary=information_tags, back_populates="informations", lazy="selectin")
     comments = relationship("Comment", back_populates="information")
     info_stocks = relationship("InfoStocks", back_populates="link")
     
     def __repr__(self):
         return f"<Information(url='{self.url}', title='{self.title}')>"
 
+# Range scan for the days filter across all sources, already in page order
+# (declared after the class because it needs the mapped column expressions)
+Index("ix_info_date_id", Information.date.desc(), Information.id.desc())
+
+# Advanced after every committed write to what the information page renders;
+# its last_value is the page's cache fingerprint. A standalone sequence (not
+# a column) so create_all can add it to an existing database.
+information_page_generation = Sequence("information_page_generation", metadata=Base.metadata)
+
+def information_list_options():
+    """Loader options for pages that render Information rows with their children"""
+    # Source rides along in the main SELECT; collections get one IN-query each
+    return (
+        joinedload(Information.source),
+        selectinload(Information.tags),
+        selectinload(Information.comments),
+    )
+
 class Comment(Base):
     __tablename__ = "information_comment"
     
     id = Column(Integer, primary_key=True, index=True)
     information_id = Column(Integer, ForeignKey("information_information.id"))
-    date = Column(Date, server_default=func.current_date())
+    date = Column(Date, default=_today, server_default=func.current_date())
     content = Column(Text)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
     
     # Relationships
     information = relationship("Information", back_populates="comments")
@@ -193,24 +236,27 @@ class InfoStocksType(Base):
     description = Column(Text)
     
     # Relationships
-    info_stocks = relationship("InfoStocks", back_populates="key_type")
+    info_stocks = relationship("InfoStocks", back_populates="key_type", lazy=_UNUSED_COLLECTION)
     
     def __repr__(self):
         return f"<InfoStocksType(typename='{self.typename}', name='{self.name}')>"
 
 class InfoStocks(Base):
     __tablename__ = "information_infostocks"
+    __table_args__ = (
+        Index("ix_infostocks_stock_keydate", "stock_id", "key_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     stock_id = Column(Integer, ForeignKey("stocks_stock.id"))
     link_id = Column(Integer, ForeignKey("information_information.id"))
-    date = Column(Date, server_default=func.current_date())
+    date = Column(Date, default=_today, server_default=func.current_date())
     title = Column(String(255))
     key_date = Column(Date, nullable=True)
     key_type_id = Column(Integer, ForeignKey("information_infostockstype.id"))
     key_value = Column(String(255))
     content = Column(Text)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
     
     # Relationships
     stock = relationship("Stock", back_populates="info_stocks")
@@ -230,7 +276,7 @@ class NotesTypes(Base):
     description = Column(Text)
     
     # Relationships
-    notes = relationship("Notes", back_populates="category")
+    notes = relationship("Notes", back_populates="category", lazy=_UNUSED_COLLECTION, passive_deletes=True)
     
     def __repr__(self):
         return f"<NotesTypes(short='{self.short}', name='{self.name}')>"
@@ -244,13 +290,16 @@ class NotesTag(Base):
     description = Column(Text)
     
     # Relationships
-    notes = relationship("Notes", back_populates="tag")
+    notes = relationship("Notes", back_populates="tag", lazy=_UNUSED_COLLECTION, passive_deletes=True)
     
     def __repr__(self):
         return f"<NotesTag(tag='{self.tag}', name='{self.name}')>"
 
 class Notes(Base):
     __tablename__ = "notes_notes"
+    __table_args__ = (
+        Index("ix_notes_date_category", "date", "category_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255))
@@ -281,8 +330,8 @@ class Update(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     notes_id = Column(Integer, ForeignKey("notes_notes.id"))
-    date = Column(Date, server_default=func.current_date())
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    date = Column(Date, default=_today, server_default=func.current_date())
+    timestamp = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
     content = Column(Text)
     
     # Relationships
@@ -290,3 +339,49 @@ class Update(Base):
     
     def __repr__(self):
         return f"<Update(notes_id={self.notes_id}, date='{self.date}')>"
+
+# Models the information page renders (the list, its sources, tags and
+# comments); a committed write to any of them advances the page generation.
+# Tag links are written through Information.tags, so a flush sees the entry.
+_PAGE_MODELS = (Information, Comment, InfoTag, InfoSource)
+_PAGE_TABLES = frozenset({model.__tablename__ for model in _PAGE_MODELS} | {information_tags.name})
+_PAGE_CHANGED = "information_page_changed"
+
+_NEXT_PAGE_GENERATION = select(information_page_generation.next_value())
+
+@event.listens_for(SessionLocal, "after_flush")
+def _note_page_flush(session, flush_context):
+    """Flag the transaction when a flush writes any page model"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _PAGE_MODELS):
+            session.info[_PAGE_CHANGED] = True
+            return
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _note_page_statement(orm_execute_state):
+    """Flag the transaction for bulk INSERT/UPDATE/DELETE statements on page tables"""
+    if orm_execute_state.is_dml and orm_execute_state.statement.table.name in _PAGE_TABLES:
+        orm_execute_state.session.info[_PAGE_CHANGED] = True
+
+@event.listens_for(SessionLocal, "after_commit")
+def _advance_page_generation(session):
+    """Advance the generation once the page's data has actually committed"""
+    if not session.info.pop(_PAGE_CHANGED, False):
+        return
+    # The session's transaction is over, so use a connection of its own; a
+    # failure here only costs a stale page and must not fail the request
+    try:
+        with session.get_bind().connect() as conn:
+            conn.execute(_NEXT_PAGE_GENERATION)
+            conn.commit()
+    except Exception:
+        logger.exception("Could not advance the information page generation")
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_page_change(session):
+    session.info.pop(_PAGE_CHANGED, None)
+
+def create_page_generation(engine):
+    """Create the page generation sequence if it is missing; safe to run from every worker"""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE SEQUENCE IF NOT EXISTS information_page_generation"))
@@ -0,0 +1,54 @@
+"""
+Keyset pagination for the JSON list endpoints.
+
+Every list endpoint pages newest first (id descending). The response body is
+the plain list of items; when more rows may follow, the X-Next-Cursor header
+carries the id to pass back as ?cursor= for the next page.
+"""
+
+from typing import Optional
+from fastapi import Query, Response
+from pydantic import TypeAdapter
+
+# Largest page a client may ask for
+MAX_PAGE_SIZE = 1000
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class PageParams:
+    """Dependency: the cursor/skip/limit query parameters of a list endpoint"""
+
+    def __init__(
+        self,
+        cursor: Optional[int] = Query(None, ge=1, description="X-Next-Cursor from the previous page"),
+        skip: int = Query(0, ge=0, description="Offset for clients without a cursor; ignored with one"),
+        limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.skip = skip
+        self.limit = limit
+
+    def apply(self, query, id_column):
+        """Order newest first and seek past the previous page on the primary key"""
+        query = query.order_by(id_column.desc())
+        if self.cursor is not None:
+            query = query.filter(id_column < self.cursor)
+        elif self.skip:
+            query = query.offset(self.skip)
+        return query.limit(self.limit)
+
+def page_response(adapter: TypeAdapter, rows: list, params: PageParams) -> Response:
+    """
+    Serialize a page straight to JSON bytes with the next cursor header.
+
+    Validating and dumping in one pydantic-core pass skips FastAPI's
+    response_model re-validation and jsonable_encoder walk.
+    """
+    headers = {}
+    if rows and len(rows) == params.limit:
+        headers[NEXT_CURSOR_HEADER] = str(rows[-1].id)
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(rows, from_attributes=True)),
+        media_type="application/json",
+        headers=headers,
+    )
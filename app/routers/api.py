@@ -3,40 +3,54 @@ API endpoints for the Door application
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from ..database import get_db
-from .. import models
+from ..database import get_engine, get_db_readonly
 
 router = APIRouter()
 
+_PING = text("SELECT 1")
+
+# All four counts in one round trip instead of one query per table
+_STATS_SQL = text(
+    "SELECT"
+    " (SELECT count(*) FROM stocks_stock) AS stocks,"
+    " (SELECT count(*) FROM information_information) AS information,"
+    " (SELECT count(*) FROM notes_notes) AS notes,"
+    " (SELECT count(*) FROM stocks_stocktrans) AS transactions"
+)
+
+# Routes below return ORJSONResponse directly: their payloads are already
+# plain JSON types, so FastAPI's jsonable_encoder pass is skipped entirely
+
 # Health check
 @router.get("/health")
 async def health_check():
     """API health check"""
-    return {"status": "healthy", "message": "API is running"}
+    return ORJSONResponse({"status": "healthy", "message": "API is running"})
 
 # Database status
 @router.get("/database/status")
-async def database_status(db: Session = Depends(get_db)):
+def database_status(db: Session = Depends(get_db_readonly)):
     """Check database connection status"""
     try:
-        db.execute("SELECT 1")
-        return {"status": "connected", "message": "Database connection successful"}
+        db.execute(_PING).scalar()
+        return ORJSONResponse({"status": "connected", "message": "Database connection successful"})
     except Exception as e:
-        return {"status": "error", "message": f"Database connection failed: {str(e)}"}
+        return ORJSONResponse({"status": "error", "message": f"Database connection failed: {str(e)}"})
+
+@router.get("/database/status/fast")
+async def database_status_fast():
+    """Report connection pool state without touching the database (for liveness probes)"""
+    return ORJSONResponse({"status": "ok", "pool": get_engine().pool.status()})
 
 # Get database statistics
 @router.get("/stats")
-async def get_stats(db: Session = Depends(get_db)):
+def get_stats(db: Session = Depends(get_db_readonly)):
     """Get application statistics"""
     try:
-        stats = {
-            "stocks": db.query(models.Stock).count(),
-            "information": db.query(models.Information).count(),
-            "notes": db.query(models.Notes).count(),
-            "transactions": db.query(models.StockTrans).count(),
-        }
-        return stats
+        stats = dict(db.execute(_STATS_SQL).one()._mapping)
+        return ORJSONResponse(stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting stats: {str(e)}")
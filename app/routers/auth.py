@@ -4,18 +4,17 @@ Authentication router for login/logout functionality
 
 from fastapi import APIRouter, Request, HTTPException, Depends, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..auth import (
     authenticate_user, 
     create_login_token, 
-    is_production_environment,
     get_session_user
 )
+from ..config import system_config
+from ..templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
@@ -25,10 +24,7 @@ async def login_page(request: Request):
     if user:
         return RedirectResponse(url="/", status_code=302)
     
-    return templates.TemplateResponse("login.html", {
-        "request": request,
-        "is_production": is_production_environment()
-    })
+    return templates.TemplateResponse("login.html", {"request": request, "is_production": system_config.is_render})
 
 @router.post("/login")
 async def login(
@@ -37,13 +33,13 @@ async def login(
     password: str = Form(...)
 ):
     """Process login form"""
-    if not is_production_environment():
+    if not system_config.is_render:
         # Skip authentication in development
         request.session["access_token"] = "dev_token"
         return RedirectResponse(url="/", status_code=302)
     
     # Authenticate user
-    if authenticate_user(username, password):
+    if await authenticate_user(username, password):
         # Create token and store in session
         token = create_login_token(username)
         request.session["access_token"] = token
@@ -53,7 +49,7 @@ async def login(
         return templates.TemplateResponse("login.html", {
             "request": request,
             "error": "Invalid username or password",
-            "is_production": is_production_environment()
+            "is_production": system_config.is_render
         })
 
 @router.get("/logout")
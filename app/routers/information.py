@@ -2,39 +2,160 @@
 Information management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import TypeAdapter
+from sqlalchemy import any_, bindparam, exists, func, select, text, update, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import List, Optional
-from ..database import get_db
+from ..database import SessionLocal, get_db, get_db_readonly
+from ..pagination import PageParams, page_response
 from .. import models
-from ..models import information_tags
+from ..models import information_list_options, information_tags
 from ..schemas import InformationResponse, InformationCreate, InformationUpdate, CommentResponse, CommentCreate
-from ..source_detection import detect_source
+from ..source_detection import detect_source, detect_sources_batch
 from ..auth import require_auth
+from ..config import is_render
+from ..templating import templates
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Core summary statement (total count + date range in one round trip),
+# built once and served from the compiled cache
+_INFORMATION_SUMMARY = select(
+    func.count(), func.min(models.Information.date), func.max(models.Information.date)
+).select_from(models.Information)
+
+# Cache fingerprint of the information page, advanced by the session events in
+# models on every committed write to what the page renders
+_READ_PAGE_GENERATION = text("SELECT last_value FROM information_page_generation")
+
+def _page_generation(db: Session) -> int:
+    return db.execute(_READ_PAGE_GENERATION).scalar()
+
+def days_cutoff(days: Optional[str] = "1") -> Optional[date]:
+    """Dependency: turn the ?days= filter into a cutoff date (None for "all", 1 day if invalid)"""
+    if days == 'all':
+        return None
+    try:
+        days_int = int(days)
+    except (TypeError, ValueError):
+        days_int = 1
+    return datetime.now().date() - timedelta(days=days_int)
+
+# Correlated probe for "has at least one tag"; NOT EXISTS plans as an index
+# anti-join on the association table's (information_id, infotag_id) primary key
+_HAS_TAG = exists().where(information_tags.c.information_id == models.Information.id)
+
+# Upper bound on rows rendered by the information page
+_PAGE_LIMIT = 1000
+
+def _parse_tag_ids(tag_ids: str) -> List[int]:
+    """Parse a comma-separated tag id string, dropping blanks, junk and duplicates"""
+    return list({int(tid) for tid in (t.strip() for t in tag_ids.split(',')) if tid.isdigit()})
+
+def _tags_by_ids(db: Session, tag_ids_list: List[int]) -> List[models.InfoTag]:
+    """Load InfoTags with id = ANY(:ids): one array parameter, one plan for any list length"""
+    ids = bindparam("tag_ids", tag_ids_list, type_=ARRAY(Integer))
+    return db.query(models.InfoTag).filter(models.InfoTag.id == any_(ids)).all()
+
+# Source/tag lists for the filter bar and modals change rarely; cached as plain
+# column rows (not ORM entities) so they are safe to share across sessions.
+# Keyed by page generation, so a write in any worker retires the entries.
+_LIST_CACHE: TTLCache = TTLCache(maxsize=4, ttl=60)
+_LIST_CACHE_LOCK = threading.Lock()
+
+def _get_sources(db: Session, generation: int) -> list:
+    """All InfoSources ordered by name, cached for up to a minute"""
+    with _LIST_CACHE_LOCK:
+        sources = _LIST_CACHE.get(('sources', generation))
+    if sources is None:
+        sources = db.query(
+            models.InfoSource.id, models.InfoSource.short, models.InfoSource.name, models.InfoSource.description
+        ).order_by(models.InfoSource.name).all()
+        with _LIST_CACHE_LOCK:
+            _LIST_CACHE[('sources', generation)] = sources
+    return sources
+
+def _get_tags(db: Session, generation: int) -> list:
+    """All InfoTags ordered by name, cached for up to a minute"""
+    with _LIST_CACHE_LOCK:
+        tags = _LIST_CACHE.get(('tags', generation))
+    if tags is None:
+        tags = db.query(
+            models.InfoTag.id, models.InfoTag.tag, models.InfoTag.name, models.InfoTag.description
+        ).order_by(models.InfoTag.name).all()
+        with _LIST_CACHE_LOCK:
+            _LIST_CACHE[('tags', generation)] = tags
+    return tags
+
+def _existing_tag_ids(db: Session, tag_ids_list: List[int]) -> List[int]:
+    """Filter tag ids down to those that exist, without loading InfoTag rows"""
+    ids = bindparam("tag_ids", tag_ids_list, type_=ARRAY(Integer))
+    return [row.id for row in db.query(models.InfoTag.id).filter(models.InfoTag.id == any_(ids))]
+
+# Caps how many single-URL detections (outbound fetches) run at once
+_DETECT_SLOTS = asyncio.Semaphore(8)
+
+async def _detect_source_async(url: str, use_cache: bool = True) -> dict:
+    """Run detect_source, bounded by the detection slots"""
+    async with _DETECT_SLOTS:
+        return await detect_source(url, use_cache=use_cache)
+
+# InfoTag ids by (tag code, page generation); tags almost never change, and a
+# new generation (any committed page write, in any worker) retires the entries
+_TAG_ID_CACHE: TTLCache = TTLCache(maxsize=16, ttl=3600)
+_TAG_ID_CACHE_LOCK = threading.Lock()
+
+def _tag_id(db: Session, code: str, generation: int) -> Optional[int]:
+    """Look up an InfoTag id by its code, caching hits until the generation moves on"""
+    with _TAG_ID_CACHE_LOCK:
+        tag_id = _TAG_ID_CACHE.get((code, generation))
+    if tag_id is None:
+        tag_id = db.query(models.InfoTag.id).filter(models.InfoTag.tag == code).scalar()
+        if tag_id is not None:
+            with _TAG_ID_CACHE_LOCK:
+                _TAG_ID_CACHE[(code, generation)] = tag_id
+    return tag_id
 
 # Information CRUD operations
 @router.get("/", response_class=HTMLResponse)
-async def information_page(
+def information_page(
     request: Request, 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_readonly),
     user: dict = Depends(require_auth),
     source: Optional[str] = None,
     days: Optional[str] = "1",
+    cutoff: Optional[date] = Depends(days_cutoff),
     no_tag: Optional[bool] = False,
-    check_tag: Optional[bool] = False
+    check_tag: Optional[bool] = False,
+    before: Optional[int] = None
 ):
     """Information management page with filtering"""
     if user is None:
-        from fastapi.responses import RedirectResponse
         return RedirectResponse(url="/auth/login", status_code=302)
     
-    from datetime import datetime, timedelta
-    from sqlalchemy import and_, or_
+    # Weak ETag over the filters, today's date (the days filter is relative) and
+    # the page generation: repeat loads are answered with 304 and no rendering.
+    # The generation is read before the data, so a write committing in between
+    # only makes the next load re-render.
+    generation = _page_generation(db)
+    etag_src = repr((source, days, no_tag, check_tag, before, date.today(), generation))
+    etag = 'W/"%s"' % hashlib.md5(etag_src.encode(), usedforsecurity=False).hexdigest()
+    cache_headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
     
     # Base queryset for information entries
     information_query = db.query(models.Information)
@@ -46,47 +167,51 @@ async def information_page(
     # Apply tag filters (mutually exclusive)
     # If "No Tag" is selected, it takes precedence over specific tag filters
     if no_tag:
-        # Filter entries that have no tags in the many-to-many relationship
-        information_query = information_query.outerjoin(information_tags).filter(information_tags.c.infotag_id.is_(None))
+        # Filter entries that have no tags in the many-to-many relationship (anti-join)
+        information_query = information_query.filter(~_HAS_TAG)
     elif check_tag:
         # Only apply specific tag filter if "No Tag" is not selected
         # Filter entries that have the "check" tag
-        check_tag_obj = db.query(models.InfoTag).filter(models.InfoTag.tag == 'check').first()
-        if check_tag_obj:
-            information_query = information_query.join(information_tags).filter(information_tags.c.infotag_id == check_tag_obj.id)
+        check_tag_id = _tag_id(db, 'check', generation)
+        if check_tag_id is not None:
+            information_query = information_query.join(information_tags).filter(information_tags.c.infotag_id == check_tag_id)
     
     # Apply days filter if not "all"
-    if days != 'all':
-        try:
-            days_int = int(days)
-            cutoff_date = datetime.now().date() - timedelta(days=days_int)
-            information_query = information_query.filter(models.Information.date >= cutoff_date)
-        except ValueError:
-            # If invalid days value, default to 1 day
-            days_int = 1
-            cutoff_date = datetime.now().date() - timedelta(days=days_int)
-            information_query = information_query.filter(models.Information.date >= cutoff_date)
-    
-    # Order the results by ID (newest entries first)
-    information_query = information_query.order_by(models.Information.id.desc())
+    if cutoff is not None:
+        information_query = information_query.filter(models.Information.date >= cutoff)
     
     # Get all info sources for the filter
-    info_sources = db.query(models.InfoSource).order_by(models.InfoSource.name).all()
+    info_sources = _get_sources(db, generation)
     
     # Get all info tags
-    info_tags = db.query(models.InfoTag).order_by(models.InfoTag.name).all()
+    info_tags = _get_tags(db, generation)
     
-    # Calculate filter statistics
-    total_count = db.query(models.Information).count()
-    filtered_count = information_query.count()
+    # Fetch the (bounded) page first, newest entries first, continuing below
+    # the ?before= id of an older page; the first page's length is the
+    # filtered count unless it was cut off
+    page_query = information_query
+    if before:
+        page_query = page_query.filter(models.Information.id < before)
+    information = (
+        page_query
+        .order_by(models.Information.id.desc())
+        .options(*information_list_options())
+        .limit(_PAGE_LIMIT)
+        .all()
+    )
+    if not before and len(information) < _PAGE_LIMIT:
+        filtered_count = len(information)
+    else:
+        # Counted from the unordered filter query: Postgres rejects an
+        # aggregate alongside an ungrouped ORDER BY column
+        filtered_count = db.query(func.count()).select_from(information_query.subquery()).scalar()
     
-    # Get date range info
-    oldest_entry = db.query(models.Information).order_by(models.Information.date).first()
-    newest_entry = db.query(models.Information).order_by(models.Information.date.desc()).first()
+    # Calculate filter statistics and date range
+    total_count, oldest_entry_date, newest_entry_date = db.execute(_INFORMATION_SUMMARY).one()
     
     return templates.TemplateResponse("information.html", {
         "request": request,
-        "information": information_query.all(),
+        "information": information,
         "info_sources": info_sources,
         "info_tags": info_tags,
         "selected_source": source,
@@ -95,23 +220,23 @@ async def information_page(
         "check_tag_filter": check_tag,
         "total_count": total_count,
         "filtered_count": filtered_count,
-        "oldest_entry_date": oldest_entry.date if oldest_entry else None,
-        "newest_entry_date": newest_entry.date if newest_entry else None,
-    })
+        "next_before": information[-1].id if len(information) == _PAGE_LIMIT else None,
+        "oldest_entry_date": oldest_entry_date,
+        "newest_entry_date": newest_entry_date,
+    }, headers=cache_headers)
+
+_INFORMATION_LIST = TypeAdapter(List[InformationResponse])
 
 @router.get("/api/information", response_model=List[InformationResponse])
-async def get_information(
-    skip: int = 0, 
-    limit: int = 100, 
+def get_information(
+    page: PageParams = Depends(), 
     source: Optional[str] = None,
-    days: Optional[str] = "1",
+    cutoff: Optional[date] = Depends(days_cutoff),
     no_tag: Optional[bool] = False,
     check_tag: Optional[bool] = False,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_readonly)
 ):
     """Get information entries with filtering"""
-    from datetime import datetime, timedelta
-    
     # Base queryset for information entries
     information_query = db.query(models.Information)
     
@@ -122,68 +247,121 @@ async def get_information(
     # Apply tag filters (mutually exclusive)
     # If "No Tag" is selected, it takes precedence over specific tag filters
     if no_tag:
-        # Filter entries that have no tags in the many-to-many relationship
-        information_query = information_query.outerjoin(information_tags).filter(information_tags.c.infotag_id.is_(None))
+        # Filter entries that have no tags in the many-to-many relationship (anti-join)
+        information_query = information_query.filter(~_HAS_TAG)
     elif check_tag:
         # Only apply specific tag filter if "No Tag" is not selected
         # Filter entries that have the "check" tag
-        check_tag_obj = db.query(models.InfoTag).filter(models.InfoTag.tag == 'check').first()
-        if check_tag_obj:
-            information_query = information_query.join(information_tags).filter(information_tags.c.infotag_id == check_tag_obj.id)
+        check_tag_id = _tag_id(db, 'check', _page_generation(db))
+        if check_tag_id is not None:
+            information_query = information_query.join(information_tags).filter(information_tags.c.infotag_id == check_tag_id)
     
     # Apply days filter if not "all"
-    if days != 'all':
-        try:
-            days_int = int(days)
-            cutoff_date = datetime.now().date() - timedelta(days=days_int)
-            information_query = information_query.filter(models.Information.date >= cutoff_date)
-        except ValueError:
-            # If invalid days value, default to 1 day
-            days_int = 1
-            cutoff_date = datetime.now().date() - timedelta(days=days_int)
-            information_query = information_query.filter(models.Information.date >= cutoff_date)
-    
-    # Order the results by ID (newest entries first)
-    information_query = information_query.order_by(models.Information.id.desc())
+    if cutoff is not None:
+        information_query = information_query.filter(models.Information.date >= cutoff)
     
-    # Apply pagination with eager loading of tags
-    from sqlalchemy.orm import joinedload
-    information = information_query.options(joinedload(models.Information.tags)).offset(skip).limit(limit).all()
-    return information
+    # Keyset page, newest first, with eager loading of tags (selectin: no row multiplication under LIMIT)
+    information = page.apply(information_query, models.Information.id).options(
+        selectinload(models.Information.tags)
+    ).all()
+    return page_response(_INFORMATION_LIST, information, page)
 
 @router.get("/api/information/{info_id}", response_model=InformationResponse)
-async def get_information_item(info_id: int, db: Session = Depends(get_db)):
+def get_information_item(info_id: int, db: Session = Depends(get_db_readonly)):
     """Get a specific information entry"""
-    from sqlalchemy.orm import joinedload
-    
     info = db.query(models.Information).options(joinedload(models.Information.tags)).filter(models.Information.id == info_id).first()
     if not info:
         raise HTTPException(status_code=404, detail="Information not found")
     return info
 
+# The handlers below await source detection (outbound fetches) on the event
+# loop; their blocking Session work runs in the threadpool through these helpers
+
+def _url_exists(db: Session, url: str) -> bool:
+    return db.query(exists().where(models.Information.url == url)).scalar()
+
+def _insert_information(db: Session, info_data: dict, tag_ids: Optional[str]) -> models.Information:
+    """Insert an information entry with its tags in one transaction"""
+    # Keep only tag ids that exist (one id = ANY(...) probe) before writing anything
+    tag_ids_list = []
+    if tag_ids:
+        tag_ids_list = _existing_tag_ids(db, _parse_tag_ids(tag_ids))
+        logger.debug("tag_ids_list: %s", tag_ids_list)
+    
+    # One transaction: flush to get the new id, link tags with a single
+    # executemany INSERT, then commit once
+    db_info = models.Information(**info_data)
+    db.add(db_info)
+    db.flush()
+    if tag_ids_list:
+        db.execute(information_tags.insert(), [
+            {"information_id": db_info.id, "infotag_id": tag_id} for tag_id in tag_ids_list
+        ])
+    db.commit()
+    
+    # Reload just the tags collection in one SELECT
+    db.refresh(db_info, attribute_names=['tags'])
+    return db_info
+
+def _information_urls(db: Session) -> list:
+    """Ids and URLs of every entry; closes the session so no transaction stays open during the fetches"""
+    rows = db.query(models.Information.id, models.Information.url).all()
+    db.close()
+    return rows
+
+def _apply_metadata_updates(mappings: List[dict]) -> None:
+    """One executemany UPDATE by primary key instead of a flush per entity, in a fresh session"""
+    with SessionLocal() as session:
+        session.execute(update(models.Information), mappings)
+        session.commit()
+
+# Titles the extractors fill in when the page could not be fetched or parsed
+_PLACEHOLDER_TITLE = re.compile(r"\((?:Failed to fetch|Parse error)\)$")
+
+def _has_fetched_metadata(result) -> bool:
+    """Whether a detection result carries a title actually read from the source"""
+    return (
+        isinstance(result, dict)
+        and result.get('success')
+        and result.get('source') != 'text'
+        and bool(result.get('title'))
+        and not _PLACEHOLDER_TITLE.search(result['title'])
+    )
+
+def _save_refreshed_metadata(db: Session, info: models.Information, title: str, content: str) -> None:
+    info.title = title
+    info.content = content
+    db.commit()
+    db.refresh(info)
+
+def _insert_detected(db: Session, info_dict: dict) -> models.Information:
+    db_info = models.Information(**info_dict)
+    db.add(db_info)
+    db.commit()
+    db.refresh(db_info)
+    return db_info
+
 @router.post("/api/information", response_model=InformationResponse)
 async def create_information(info: InformationCreate, db: Session = Depends(get_db)):
     """Create a new information entry with automatic source detection"""
     try:
         # Check if URL already exists
-        existing_info = db.query(models.Information).filter(models.Information.url == info.url).first()
-        if existing_info:
+        if await run_in_threadpool(_url_exists, db, info.url):
             raise HTTPException(status_code=400, detail="Information with this URL already exists")
         
         # Handle tag updates if provided
         tag_ids = getattr(info, 'tag_ids', None)
-        print(f"DEBUG: tag_ids received: {tag_ids}")
+        logger.debug("tag_ids received: %s", tag_ids)
         
         # Run source detection to get title, content, and source
         try:
-            detection_result = detect_source(info.url)
-            print(f"DEBUG: Source detection result: {detection_result}")
+            detection_result = await _detect_source_async(info.url)
+            logger.debug("Source detection result: %s", detection_result)
         except Exception as e:
-            print(f"DEBUG: Source detection failed: {e}")
+            logger.debug("Source detection failed: %s", e)
             detection_result = {'success': False, 'error': str(e)}
         
         # Create the information entry with explicit date and updated_at
-        from datetime import datetime, timezone
         info_data = info.dict(exclude={'tag_ids'})
         now = datetime.now(timezone.utc)
         info_data['date'] = now
@@ -204,50 +382,35 @@ async def create_information(info: InformationCreate, db: Session = Depends(get_
         if not info_data.get('source_id'):
             info_data['source_id'] = 1  # Default to YouTube
         
-        db_info = models.Information(**info_data)
-        db.add(db_info)
-        db.commit()
-        db.refresh(db_info)
-        
-        # Add tags if provided
-        if tag_ids:
-            tag_ids_list = [int(tid.strip()) for tid in tag_ids.split(',') if tid.strip()]
-            print(f"DEBUG: tag_ids_list: {tag_ids_list}")
-            new_tags = db.query(models.InfoTag).filter(models.InfoTag.id.in_(tag_ids_list)).all()
-            print(f"DEBUG: new_tags found: {[tag.id for tag in new_tags]}")
-            db_info.tags.extend(new_tags)
-            db.commit()
-        
-        # Refresh and eager load tags to avoid relationship issues
-        from sqlalchemy.orm import joinedload
-        db.refresh(db_info)
-        db_info = db.query(models.Information).options(joinedload(models.Information.tags)).filter(models.Information.id == db_info.id).first()
-        
-        return db_info
+        return await run_in_threadpool(_insert_information, db, info_data, tag_ids)
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=500, detail=f"Error creating information: {str(e)}")
 
 @router.put("/api/information/{info_id}", response_model=InformationResponse)
-async def update_information(info_id: int, info: InformationUpdate, db: Session = Depends(get_db)):
+def update_information(info_id: int, info: InformationUpdate, db: Session = Depends(get_db)):
     """Update an information entry"""
-    db_info = db.query(models.Information).filter(models.Information.id == info_id).first()
+    db_info = db.get(models.Information, info_id)
     if not db_info:
         raise HTTPException(status_code=404, detail="Information not found")
     
     # Handle tag updates if provided
     tag_ids = getattr(info, 'tag_ids', None)
-    print(f"DEBUG: tag_ids received: {tag_ids}")
+    logger.debug("tag_ids received: %s", tag_ids)
     if tag_ids is not None:
+        # Tag changes only touch the association table; bump updated_at so the
+        # row still records the edit
+        db_info.updated_at = datetime.now(timezone.utc)
+        
         # Clear existing tags
         db_info.tags.clear()
         
         # Add new tags
         if tag_ids:
-            tag_ids_list = [int(tid.strip()) for tid in tag_ids.split(',') if tid.strip()]
-            print(f"DEBUG: tag_ids_list: {tag_ids_list}")
-            new_tags = db.query(models.InfoTag).filter(models.InfoTag.id.in_(tag_ids_list)).all()
-            print(f"DEBUG: new_tags found: {[tag.id for tag in new_tags]}")
+            tag_ids_list = _parse_tag_ids(tag_ids)
+            logger.debug("tag_ids_list: %s", tag_ids_list)
+            new_tags = _tags_by_ids(db, tag_ids_list)
+            logger.debug("new_tags found: %s", new_tags)
             db_info.tags.extend(new_tags)
     
     # Update other fields
@@ -256,17 +419,15 @@ async def update_information(info_id: int, info: InformationUpdate, db: Session
     
     db.commit()
     
-    # Refresh and eager load tags to avoid relationship issues
-    from sqlalchemy.orm import joinedload
-    db.refresh(db_info)
-    db_info = db.query(models.Information).options(joinedload(models.Information.tags)).filter(models.Information.id == db_info.id).first()
+    # Reload just the tags collection in one SELECT instead of refresh + requery
+    db.refresh(db_info, attribute_names=['tags'])
     
     return db_info
 
 @router.delete("/api/information/{info_id}")
-async def delete_information(info_id: int, db: Session = Depends(get_db)):
+def delete_information(info_id: int, db: Session = Depends(get_db)):
     """Delete an information entry"""
-    info = db.query(models.Information).filter(models.Information.id == info_id).first()
+    info = db.get(models.Information, info_id)
     if not info:
         raise HTTPException(status_code=404, detail="Information not found")
     
@@ -276,7 +437,7 @@ async def delete_information(info_id: int, db: Session = Depends(get_db)):
 
 # InfoSource management endpoints
 @router.post("/api/sources")
-async def create_or_update_source(source_data: dict, db: Session = Depends(get_db)):
+def create_or_update_source(source_data: dict, db: Session = Depends(get_db)):
     """Create or update an InfoSource"""
     try:
         source_id = source_data.get('id')
@@ -289,7 +450,7 @@ async def create_or_update_source(source_data: dict, db: Session = Depends(get_d
         
         if source_id:
             # Update existing source
-            source = db.query(models.InfoSource).filter(models.InfoSource.id == source_id).first()
+            source = db.get(models.InfoSource, source_id)
             if not source:
                 raise HTTPException(status_code=404, detail="Source not found")
             source.short = short
@@ -310,7 +471,7 @@ async def create_or_update_source(source_data: dict, db: Session = Depends(get_d
 
 # InfoTag management endpoints
 @router.post("/api/tags")
-async def create_or_update_tag(tag_data: dict, db: Session = Depends(get_db)):
+def create_or_update_tag(tag_data: dict, db: Session = Depends(get_db)):
     """Create or update an InfoTag"""
     try:
         tag_id = tag_data.get('id')
@@ -323,7 +484,7 @@ async def create_or_update_tag(tag_data: dict, db: Session = Depends(get_db)):
         
         if tag_id:
             # Update existing tag
-            tag = db.query(models.InfoTag).filter(models.InfoTag.id == tag_id).first()
+            tag = db.get(models.InfoTag, tag_id)
             if not tag:
                 raise HTTPException(status_code=404, detail="Tag not found")
             tag.tag = tag_code
@@ -346,11 +507,37 @@ async def create_or_update_tag(tag_data: dict, db: Session = Depends(get_db)):
 @router.post("/api/update-all")
 async def update_all_documents(db: Session = Depends(get_db)):
     """Update all information entries from their sources"""
+    # Render saves URLs without fetching, so detection there only yields
+    # placeholder titles; never write those over the stored metadata
+    if is_render():
+        return {"message": "Metadata extraction is disabled on Render", "updated": 0, "failed": 0}
+    
     try:
-        # This would implement the same logic as the Django version
-        # For now, just return a success message
-        return {"message": "Update all documents functionality not yet implemented"}
+        rows = await run_in_threadpool(_information_urls, db)
+        
+        # Fetches overlap on the event loop, a bounded number at a time; every
+        # page is fetched again, the metadata caches only serve adds
+        results = await detect_sources_batch([row.url for row in rows], use_cache=False)
+        
+        # Only entries whose extractor fetched real metadata are written, so a
+        # failed fetch never replaces a stored title with a placeholder
+        now = datetime.now(timezone.utc)
+        mappings = [
+            {"id": row.id, "title": result['title'], "content": result['content'], "updated_at": now}
+            for row, result in zip(rows, results)
+            if _has_fetched_metadata(result)
+        ]
+        
+        if mappings:
+            await run_in_threadpool(_apply_metadata_updates, mappings)
+        
+        return {
+            "message": f"Updated {len(mappings)} of {len(rows)} documents",
+            "updated": len(mappings),
+            "failed": len(rows) - len(mappings)
+        }
     except Exception as e:
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Refresh metadata from URL endpoint
@@ -359,21 +546,16 @@ async def refresh_information_metadata(info_id: int, db: Session = Depends(get_d
     """Refresh metadata for an existing information entry by re-detecting from URL"""
     try:
         # Get the existing information entry
-        info = db.query(models.Information).filter(models.Information.id == info_id).first()
+        info = await run_in_threadpool(db.get, models.Information, info_id)
         if not info:
             raise HTTPException(status_code=404, detail="Information entry not found")
         
         # Use standalone source detection to get fresh metadata
-        result = detect_source(info.url)
+        result = await _detect_source_async(info.url, use_cache=False)
         
         if result['success']:
             # Update the information entry with fresh metadata
-            info.title = result['title']
-            info.content = result['content']
-            
-            # Commit the changes
-            db.commit()
-            db.refresh(info)
+            await run_in_threadpool(_save_refreshed_metadata, db, info, result['title'], result['content'])
             
             return {
                 "message": "Metadata refreshed successfully",
@@ -391,7 +573,7 @@ async def refresh_information_metadata(info_id: int, db: Session = Depends(get_d
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Metadata detection endpoint (without creating entry)
@@ -400,7 +582,7 @@ async def detect_metadata_endpoint(url: str):
     """Detect source and extract metadata from URL without creating entry"""
     try:
         # Use standalone source detection (no Django dependencies)
-        result = detect_source(url)
+        result = await _detect_source_async(url)
         
         if result['success']:
             return {
@@ -422,7 +604,7 @@ async def detect_source_endpoint(url: str, db: Session = Depends(get_db)):
     """Detect source and extract metadata from URL and create entry"""
     try:
         # Use standalone source detection (no Django dependencies)
-        result = detect_source(url)
+        result = await _detect_source_async(url)
         
         if result['success']:
             # Create information entry with detected metadata
@@ -434,16 +616,12 @@ async def detect_source_endpoint(url: str, db: Session = Depends(get_db)):
             )
             
             # Create the information entry with explicit date and updated_at
-            from datetime import datetime, timezone
             info_dict = info_data.dict()
             now = datetime.now(timezone.utc)
             info_dict['date'] = now
             info_dict['updated_at'] = now
             
-            db_info = models.Information(**info_dict)
-            db.add(db_info)
-            db.commit()
-            db.refresh(db_info)
+            db_info = await run_in_threadpool(_insert_detected, db, info_dict)
             
             return {
                 "success": True,
@@ -461,22 +639,21 @@ async def detect_source_endpoint(url: str, db: Session = Depends(get_db)):
 
 # Comments
 @router.get("/api/information/{info_id}/comments", response_model=List[CommentResponse])
-async def get_comments(info_id: int, db: Session = Depends(get_db)):
+def get_comments(info_id: int, db: Session = Depends(get_db_readonly)):
     """Get comments for an information entry"""
     comments = db.query(models.Comment).filter(models.Comment.information_id == info_id).all()
     return comments
 
 @router.post("/api/information/{info_id}/comments", response_model=CommentResponse)
-async def create_comment(info_id: int, comment: CommentCreate, db: Session = Depends(get_db)):
+def create_comment(info_id: int, comment: CommentCreate, db: Session = Depends(get_db)):
     """Create a comment for an information entry"""
     try:
         # Check if information entry exists
-        info = db.query(models.Information).filter(models.Information.id == info_id).first()
+        info = db.get(models.Information, info_id)
         if not info:
             raise HTTPException(status_code=404, detail="Information entry not found")
         
         # Create comment with explicit date and updated_at
-        from datetime import datetime, timezone, date
         comment_data = comment.dict()
         comment_data['information_id'] = info_id
         comment_data['date'] = date.today()
@@ -3,48 +3,66 @@ Notes management endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, load_only, selectinload
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_db, get_db_readonly
+from ..pagination import PageParams, page_response
 from .. import models
 from ..schemas import NotesResponse, NotesCreate, NotesUpdate, UpdateResponse, UpdateCreate
 from ..auth import require_auth
+from ..templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Notes rendered per page on the notes page
+PAGE = 100
 
 # Notes CRUD operations
 @router.get("/", response_class=HTMLResponse)
-async def notes_page(request: Request, db: Session = Depends(get_db), user: dict = Depends(require_auth)):
+def notes_page(request: Request, before: Optional[int] = None, db: Session = Depends(get_db_readonly), user: dict = Depends(require_auth)):
     """Notes management page"""
     if user is None:
-        from fastapi.responses import RedirectResponse
         return RedirectResponse(url="/auth/login", status_code=302)
     
-    notes = db.query(models.Notes).all()
+    # Only the columns the table shows (content is loaded on demand by the view/edit
+    # modals), plus the category and tag badges of every row
+    notes_query = db.query(models.Notes).options(
+        load_only(
+            models.Notes.id, models.Notes.title, models.Notes.date, models.Notes.timestamp,
+            models.Notes.category_id, models.Notes.tag_id
+        ),
+        selectinload(models.Notes.category),
+        selectinload(models.Notes.tag),
+    )
+    if before:
+        notes_query = notes_query.filter(models.Notes.id < before)
+    notes = notes_query.order_by(models.Notes.id.desc()).limit(PAGE).all()
     return templates.TemplateResponse("notes.html", {
         "request": request,
-        "notes": notes
+        "notes": notes,
+        "next_before": notes[-1].id if len(notes) == PAGE else None
     })
 
+_NOTES_LIST = TypeAdapter(List[NotesResponse])
+
 @router.get("/api/notes", response_model=List[NotesResponse])
-async def get_notes(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all notes"""
-    notes = db.query(models.Notes).offset(skip).limit(limit).all()
-    return notes
+def get_notes(page: PageParams = Depends(), db: Session = Depends(get_db_readonly)):
+    """Get notes, newest first, one keyset page at a time"""
+    notes = page.apply(db.query(models.Notes), models.Notes.id).all()
+    return page_response(_NOTES_LIST, notes, page)
 
 @router.get("/api/notes/{note_id}", response_model=NotesResponse)
-async def get_note(note_id: int, db: Session = Depends(get_db)):
+def get_note(note_id: int, db: Session = Depends(get_db_readonly)):
     """Get a specific note"""
-    note = db.query(models.Notes).filter(models.Notes.id == note_id).first()
+    note = db.get(models.Notes, note_id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return note
 
 @router.post("/api/notes", response_model=NotesResponse)
-async def create_note(note: NotesCreate, db: Session = Depends(get_db)):
+def create_note(note: NotesCreate, db: Session = Depends(get_db)):
     """Create a new note"""
     db_note = models.Notes(**note.dict())
     db.add(db_note)
@@ -53,9 +71,9 @@ async def create_note(note: NotesCreate, db: Session = Depends(get_db)):
     return db_note
 
 @router.put("/api/notes/{note_id}", response_model=NotesResponse)
-async def update_note(note_id: int, note: NotesUpdate, db: Session = Depends(get_db)):
+def update_note(note_id: int, note: NotesUpdate, db: Session = Depends(get_db)):
     """Update a note"""
-    db_note = db.query(models.Notes).filter(models.Notes.id == note_id).first()
+    db_note = db.get(models.Notes, note_id)
     if not db_note:
         raise HTTPException(status_code=404, detail="Note not found")
     
@@ -67,9 +85,9 @@ async def update_note(note_id: int, note: NotesUpdate, db: Session = Depends(get
     return db_note
 
 @router.delete("/api/notes/{note_id}")
-async def delete_note(note_id: int, db: Session = Depends(get_db)):
+def delete_note(note_id: int, db: Session = Depends(get_db)):
     """Delete a note"""
-    note = db.query(models.Notes).filter(models.Notes.id == note_id).first()
+    note = db.get(models.Notes, note_id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     
@@ -79,13 +97,13 @@ async def delete_note(note_id: int, db: Session = Depends(get_db)):
 
 # Note updates
 @router.get("/api/notes/{note_id}/updates", response_model=List[UpdateResponse])
-async def get_note_updates(note_id: int, db: Session = Depends(get_db)):
+def get_note_updates(note_id: int, db: Session = Depends(get_db_readonly)):
     """Get updates for a note"""
     updates = db.query(models.Update).filter(models.Update.notes_id == note_id).all()
     return updates
 
 @router.post("/api/notes/{note_id}/updates", response_model=UpdateResponse)
-async def create_note_update(note_id: int, update: UpdateCreate, db: Session = Depends(get_db)):
+def create_note_update(note_id: int, update: UpdateCreate, db: Session = Depends(get_db)):
     """Create an update for a note"""
     update_data = update.dict()
     update_data['notes_id'] = note_id
@@ -3,15 +3,17 @@ Settings management endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse
+from sqlalchemy import exists
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
-from ..database import get_db
+from ..database import get_db, get_db_readonly
 from .. import models
 from ..schemas import NotesTypesResponse, NotesTagResponse
 from ..auth import require_auth
+from ..templating import templates
 
 # Request schemas for API endpoints
 class CategoryCreate(BaseModel):
@@ -25,14 +27,12 @@ class TagCreate(BaseModel):
     description: str = ""
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 # Settings page
 @router.get("/", response_class=HTMLResponse)
-async def settings_page(request: Request, db: Session = Depends(get_db), user: dict = Depends(require_auth)):
+def settings_page(request: Request, db: Session = Depends(get_db_readonly), user: dict = Depends(require_auth)):
     """Settings management page"""
     if user is None:
-        from fastapi.responses import RedirectResponse
         return RedirectResponse(url="/auth/login", status_code=302)
     
     # Get all categories and tags for management
@@ -47,33 +47,30 @@ async def settings_page(request: Request, db: Session = Depends(get_db), user: d
 
 # Categories CRUD operations
 @router.get("/api/categories", response_model=List[NotesTypesResponse])
-async def get_categories(db: Session = Depends(get_db)):
+def get_categories(db: Session = Depends(get_db_readonly)):
     """Get all note categories"""
     categories = db.query(models.NotesTypes).all()
     return categories
 
 @router.post("/api/categories")
-async def create_category(category_data: CategoryCreate, db: Session = Depends(get_db)):
+def create_category(category_data: CategoryCreate, db: Session = Depends(get_db)):
     """Create a new category"""
-    # Check if short code already exists
-    existing = db.query(models.NotesTypes).filter(models.NotesTypes.short == category_data.short).first()
-    if existing:
+    # Insert unless the short code is taken, in one race-free round-trip
+    category_id = db.execute(
+        insert(models.NotesTypes)
+        .values(short=category_data.short, name=category_data.name, description=category_data.description)
+        .on_conflict_do_nothing(index_elements=[models.NotesTypes.short])
+        .returning(models.NotesTypes.id)
+    ).scalar()
+    if category_id is None:
         raise HTTPException(status_code=400, detail="Category with this short code already exists")
-    
-    category = models.NotesTypes(
-        short=category_data.short,
-        name=category_data.name,
-        description=category_data.description
-    )
-    db.add(category)
     db.commit()
-    db.refresh(category)
-    return {"message": "Category created successfully", "category_id": category.id}
+    return {"message": "Category created successfully", "category_id": category_id}
 
 @router.put("/api/categories/{category_id}")
-async def update_category(category_id: int, short: str, name: str, description: str = "", db: Session = Depends(get_db)):
+def update_category(category_id: int, short: str, name: str, description: str = "", db: Session = Depends(get_db)):
     """Update a category"""
-    category = db.query(models.NotesTypes).filter(models.NotesTypes.id == category_id).first()
+    category = db.get(models.NotesTypes, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
@@ -92,15 +89,16 @@ async def update_category(category_id: int, short: str, name: str, description:
     return {"message": "Category updated successfully"}
 
 @router.delete("/api/categories/{category_id}")
-async def delete_category(category_id: int, db: Session = Depends(get_db)):
+def delete_category(category_id: int, db: Session = Depends(get_db)):
     """Delete a category"""
-    category = db.query(models.NotesTypes).filter(models.NotesTypes.id == category_id).first()
+    category = db.get(models.NotesTypes, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
     # Check if category is in use
-    notes_count = db.query(models.Notes).filter(models.Notes.category_id == category_id).count()
-    if notes_count > 0:
+    # EXISTS stops at the first referencing note; the count is only for the message
+    if db.query(exists().where(models.Notes.category_id == category_id)).scalar():
+        notes_count = db.query(models.Notes).filter(models.Notes.category_id == category_id).count()
         raise HTTPException(status_code=400, detail=f"Cannot delete category. It is used by {notes_count} note(s)")
     
     db.delete(category)
@@ -109,33 +107,30 @@ async def delete_category(category_id: int, db: Session = Depends(get_db)):
 
 # Tags CRUD operations
 @router.get("/api/tags", response_model=List[NotesTagResponse])
-async def get_tags(db: Session = Depends(get_db)):
+def get_tags(db: Session = Depends(get_db_readonly)):
     """Get all note tags"""
     tags = db.query(models.NotesTag).all()
     return tags
 
 @router.post("/api/tags")
-async def create_tag(tag_data: TagCreate, db: Session = Depends(get_db)):
+def create_tag(tag_data: TagCreate, db: Session = Depends(get_db)):
     """Create a new tag"""
-    # Check if tag code already exists
-    existing = db.query(models.NotesTag).filter(models.NotesTag.tag == tag_data.tag).first()
-    if existing:
+    # Insert unless the tag code is taken, in one race-free round-trip
+    tag_id = db.execute(
+        insert(models.NotesTag)
+        .values(tag=tag_data.tag, name=tag_data.name, description=tag_data.description)
+        .on_conflict_do_nothing(index_elements=[models.NotesTag.tag])
+        .returning(models.NotesTag.id)
+    ).scalar()
+    if tag_id is None:
         raise HTTPException(status_code=400, detail="Tag with this code already exists")
-    
-    new_tag = models.NotesTag(
-        tag=tag_data.tag,
-        name=tag_data.name,
-        description=tag_data.description
-    )
-    db.add(new_tag)
     db.commit()
-    db.refresh(new_tag)
-    return {"message": "Tag created successfully", "tag_id": new_tag.id}
+    return {"message": "Tag created successfully", "tag_id": tag_id}
 
 @router.put("/api/tags/{tag_id}")
-async def update_tag(tag_id: int, tag: str, name: str, description: str = "", db: Session = Depends(get_db)):
+def update_tag(tag_id: int, tag: str, name: str, description: str = "", db: Session = Depends(get_db)):
     """Update a tag"""
-    tag_obj = db.query(models.NotesTag).filter(models.NotesTag.id == tag_id).first()
+    tag_obj = db.get(models.NotesTag, tag_id)
     if not tag_obj:
         raise HTTPException(status_code=404, detail="Tag not found")
     
@@ -154,15 +149,16 @@ async def update_tag(tag_id: int, tag: str, name: str, description: str = "", db
     return {"message": "Tag updated successfully"}
 
 @router.delete("/api/tags/{tag_id}")
-async def delete_tag(tag_id: int, db: Session = Depends(get_db)):
+def delete_tag(tag_id: int, db: Session = Depends(get_db)):
     """Delete a tag"""
-    tag_obj = db.query(models.NotesTag).filter(models.NotesTag.id == tag_id).first()
+    tag_obj = db.get(models.NotesTag, tag_id)
     if not tag_obj:
         raise HTTPException(status_code=404, detail="Tag not found")
     
     # Check if tag is in use
-    notes_count = db.query(models.Notes).filter(models.Notes.tag_id == tag_id).count()
-    if notes_count > 0:
+    # EXISTS stops at the first referencing note; the count is only for the message
+    if db.query(exists().where(models.Notes.tag_id == tag_id)).scalar():
+        notes_count = db.query(models.Notes).filter(models.Notes.tag_id == tag_id).count()
         raise HTTPException(status_code=400, detail=f"Cannot delete tag. It is used by {notes_count} note(s)")
     
     db.delete(tag_obj)
@@ -3,24 +3,25 @@ Stock management endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import TypeAdapter
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from ..database import get_db
+from typing import List
+from ..database import get_db, get_db_readonly
+from ..pagination import PageParams, page_response
 from .. import models
 from ..schemas import StockResponse, StockCreate, StockUpdate, StockTransResponse, StockTransCreate
 from ..auth import require_auth
+from ..templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 # Stock CRUD operations
 @router.get("/", response_class=HTMLResponse)
-async def stocks_page(request: Request, db: Session = Depends(get_db), user: dict = Depends(require_auth)):
+def stocks_page(request: Request, db: Session = Depends(get_db_readonly), user: dict = Depends(require_auth)):
     """Stocks management page"""
     if user is None:
-        from fastapi.responses import RedirectResponse
         return RedirectResponse(url="/auth/login", status_code=302)
     
     stocks = db.query(models.Stock).all()
@@ -30,38 +31,41 @@ async def stocks_page(request: Request, db: Session = Depends(get_db), user: dic
         "user": user
     })
 
+_STOCK_LIST = TypeAdapter(List[StockResponse])
+
 @router.get("/api/stocks", response_model=List[StockResponse])
-async def get_stocks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all stocks"""
-    stocks = db.query(models.Stock).offset(skip).limit(limit).all()
-    return stocks
+def get_stocks(page: PageParams = Depends(), db: Session = Depends(get_db_readonly)):
+    """Get stocks, newest first, one keyset page at a time"""
+    stocks = page.apply(db.query(models.Stock), models.Stock.id).all()
+    return page_response(_STOCK_LIST, stocks, page)
 
 @router.get("/api/stocks/{stock_id}", response_model=StockResponse)
-async def get_stock(stock_id: int, db: Session = Depends(get_db)):
+def get_stock(stock_id: int, db: Session = Depends(get_db_readonly)):
     """Get a specific stock"""
-    stock = db.query(models.Stock).filter(models.Stock.id == stock_id).first()
+    stock = db.get(models.Stock, stock_id)
     if not stock:
         raise HTTPException(status_code=404, detail="Stock not found")
     return stock
 
 @router.post("/api/stocks", response_model=StockResponse)
-async def create_stock(stock: StockCreate, db: Session = Depends(get_db)):
+def create_stock(stock: StockCreate, db: Session = Depends(get_db)):
     """Create a new stock"""
-    # Check if stock already exists
-    existing_stock = db.query(models.Stock).filter(models.Stock.stick == stock.stick).first()
-    if existing_stock:
+    # Insert unless the ticker is taken, in one race-free round-trip
+    db_stock = db.scalars(
+        insert(models.Stock)
+        .values(**stock.dict())
+        .on_conflict_do_nothing(index_elements=[models.Stock.stick])
+        .returning(models.Stock)
+    ).first()
+    if db_stock is None:
         raise HTTPException(status_code=400, detail="Stock with this ticker already exists")
-    
-    db_stock = models.Stock(**stock.dict())
-    db.add(db_stock)
     db.commit()
-    db.refresh(db_stock)
     return db_stock
 
 @router.put("/api/stocks/{stock_id}", response_model=StockResponse)
-async def update_stock(stock_id: int, stock: StockUpdate, db: Session = Depends(get_db)):
+def update_stock(stock_id: int, stock: StockUpdate, db: Session = Depends(get_db)):
     """Update a stock"""
-    db_stock = db.query(models.Stock).filter(models.Stock.id == stock_id).first()
+    db_stock = db.get(models.Stock, stock_id)
     if not db_stock:
         raise HTTPException(status_code=404, detail="Stock not found")
     
@@ -73,9 +77,9 @@ async def update_stock(stock_id: int, stock: StockUpdate, db: Session = Depends(
     return db_stock
 
 @router.delete("/api/stocks/{stock_id}")
-async def delete_stock(stock_id: int, db: Session = Depends(get_db)):
+def delete_stock(stock_id: int, db: Session = Depends(get_db)):
     """Delete a stock"""
-    stock = db.query(models.Stock).filter(models.Stock.id == stock_id).first()
+    stock = db.get(models.Stock, stock_id)
     if not stock:
         raise HTTPException(status_code=404, detail="Stock not found")
     
@@ -84,17 +88,29 @@ async def delete_stock(stock_id: int, db: Session = Depends(get_db)):
     return {"message": "Stock deleted successfully"}
 
 # Stock transactions
+_TRANSACTION_LIST = TypeAdapter(List[StockTransResponse])
+
 @router.get("/api/transactions", response_model=List[StockTransResponse])
-async def get_transactions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all stock transactions"""
-    transactions = db.query(models.StockTrans).offset(skip).limit(limit).all()
-    return transactions
+def get_transactions(page: PageParams = Depends(), db: Session = Depends(get_db_readonly)):
+    """Get stock transactions, newest first, one keyset page at a time"""
+    transactions = page.apply(db.query(models.StockTrans), models.StockTrans.id).all()
+    return page_response(_TRANSACTION_LIST, transactions, page)
 
 @router.post("/api/transactions", response_model=StockTransResponse)
-async def create_transaction(transaction: StockTransCreate, db: Session = Depends(get_db)):
+def create_transaction(transaction: StockTransCreate, db: Session = Depends(get_db)):
     """Create a new stock transaction"""
     db_transaction = models.StockTrans(**transaction.dict())
     db.add(db_transaction)
     db.commit()
     db.refresh(db_transaction)
     return db_transaction
+
+@router.post("/api/transactions/bulk")
+def create_transactions_bulk(transactions: List[StockTransCreate], db: Session = Depends(get_db)):
+    """Create many stock transactions in one batched INSERT"""
+    if transactions:
+        # ORM bulk insert: no per-row unit-of-work or refresh; the engine's
+        # insertmanyvalues page size splits very large lists into batches
+        db.execute(insert(models.StockTrans), [t.dict() for t in transactions])
+        db.commit()
+    return {"inserted": len(transactions)}
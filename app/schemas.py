@@ -2,7 +2,7 @@
 Pydantic schemas for request/response validation
 """
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional, List
 from datetime import datetime, date
 from decimal import Decimal
@@ -29,8 +29,7 @@ class StockResponse(StockBase):
     id: int
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Stock Transaction schemas
 class StockTransBase(BaseModel):
@@ -50,8 +49,7 @@ class StockTransResponse(StockTransBase):
     id: int
     stock_id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Information schemas
 class InformationBase(BaseModel):
@@ -77,8 +75,7 @@ class InfoTagResponse(BaseModel):
     name: str
     description: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InformationResponse(InformationBase):
     id: int
@@ -86,8 +83,7 @@ class InformationResponse(InformationBase):
     updated_at: datetime
     tags: List[InfoTagResponse] = []
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Comment schemas
 class CommentBase(BaseModel):
@@ -102,8 +98,7 @@ class CommentResponse(CommentBase):
     date: date
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Notes schemas
 class NotesBase(BaseModel):
@@ -126,8 +121,7 @@ class NotesResponse(NotesBase):
     timestamp: datetime
     date: date
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Update schemas
 class UpdateBase(BaseModel):
@@ -142,8 +136,7 @@ class UpdateResponse(UpdateBase):
     date: date
     timestamp: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Source detection schema
 class SourceDetectionRequest(BaseModel):
@@ -164,8 +157,7 @@ class NotesTypesResponse(BaseModel):
     name: str
     description: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Notes Tags schemas
 class NotesTagResponse(BaseModel):
@@ -174,5 +166,4 @@ class NotesTagResponse(BaseModel):
     name: str
     description: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,155 @@
+"""
+Shared HTTP client and parsing helpers for the source extractors.
+One pooled AsyncClient is reused by every fetch so connections stay warm.
+"""
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+from dateutil import parser as _dateutil_parser
+
+# Browser-like headers, built once and set on the client; read-only
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'br, gzip, deflate',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# requests followed redirects by default; keep that behaviour for short links
+client = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    headers=DEFAULT_HEADERS,
+    follow_redirects=True,
+    # Batched detection keeps at most 16 fetches in flight; idle keep-alive
+    # connections are held long enough to be reused across a batch
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30),
+)
+
+
+async def close_client():
+    """Close the shared client's pooled connections (called on app shutdown)"""
+    await client.aclose()
+
+
+# Pages only need their <head> and first screen of markup; stop reading after
+# this much so a link to a large download cannot pin memory
+MAX_HTML_BYTES = 2_000_000
+
+_HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+
+async def fetch_html(url, max_bytes=MAX_HTML_BYTES, validators=None):
+    """
+    Stream an HTML page, reading at most max_bytes of the body.
+    
+    Args:
+        url (str): The page URL
+        max_bytes (int): Stop reading the body after this many bytes
+        validators (dict): ETag/Last-Modified from an earlier fetch, sent as
+            If-None-Match/If-Modified-Since
+        
+    Returns:
+        tuple: (body, validators) where body is the (possibly truncated) page,
+            b'' when the response is not HTML, or None when the server answered
+            304 Not Modified; validators holds this response's ETag/Last-Modified
+    """
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    
+    async with client.stream('GET', url, headers=headers) as response:
+        if response.status_code == 304 and validators:
+            return None, validators
+        response.raise_for_status()
+        fresh = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+        }
+        content_type = response.headers.get('content-type', '')
+        if content_type and not content_type.lower().startswith(_HTML_TYPES):
+            return b'', fresh
+        body = bytearray()
+        async for chunk in response.aiter_bytes(chunk_size=16384):
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                break
+        return bytes(body[:max_bytes]), fresh
+
+
+
+async def fetch_soup(url, validators=None, max_bytes=MAX_HTML_BYTES):
+    """
+    Fetch a page with fetch_html and parse it with lxml.
+    
+    Returns:
+        tuple: (soup, validators); soup is None when the server answered
+            304 Not Modified, and an empty document for non-HTML responses
+    """
+    body, validators = await fetch_html(url, max_bytes=max_bytes, validators=validators)
+    if body is None:
+        return None, validators
+    return BeautifulSoup(body, 'lxml'), validators
+
+
+@lru_cache(maxsize=1024)
+def url_host(url):
+    """Lower-cased host of a URL, or '' when it has none; parsed once per URL"""
+    try:
+        return urlsplit(url).hostname or ''
+    except ValueError:
+        # e.g. a malformed [IPv6] netloc in pasted text
+        return ''
+
+
+def element_text(element):
+    """Text of a matched element; meta tags carry it in their content attribute"""
+    if element.name == 'meta':
+        return element.get('content', '').strip()
+    return element.get_text().strip()
+
+
+def extract_first_match(soup, selectors, min_len=1, exclude=()):
+    """
+    Try compiled selectors in priority order and return the first usable text.
+    
+    Only the first element each selector matches is considered, as with
+    select_one. Text shorter than min_len or listed in exclude is skipped.
+    
+    Returns:
+        str: The matched text, or '' if no selector produced one
+    """
+    for selector in selectors:
+        element = selector.select_one(soup)
+        if element:
+            text = element_text(element)
+            if len(text) >= min_len and text not in exclude:
+                return text
+    return ''
+
+
+def parse_published_date(text):
+    """
+    Parse a page's publication date as an aware UTC datetime.
+    
+    Meta tags and <time datetime> are nearly always ISO-8601, which the C
+    fromisoformat handles; anything else falls back to dateutil.
+    
+    Raises:
+        ValueError: If the text is not a recognisable date
+    """
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        parsed = _dateutil_parser.parse(text)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
@@ -2,18 +2,85 @@
 General web source detection and metadata extraction module.
 This handles URLs that don't match any specific platform.
 """
+import logging
 import re
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from cachetools import TTLCache
 from datetime import datetime, timezone
+from ._fetch import element_text, fetch_soup, parse_published_date
 
+logger = logging.getLogger(__name__)
 
-def extract_web_metadata(url):
+_URL_RE = re.compile(r'https?://[^\s]+')
+_TRAIL_PUNCT_RE = re.compile(r'[.,;:!?]+$')
+_DOMAIN_RE = re.compile(r'https?://(www\.)?')
+
+# Successful extractions by URL, so re-submitted links skip the fetch and parse;
+# only touched from the event loop thread, so no lock is needed
+_META_CACHE = TTLCache(maxsize=1024, ttl=3600)
+
+# Validators and extraction per URL, kept longer than the metadata cache so an
+# expired entry can be revalidated with a conditional GET instead of re-parsed
+_REVALIDATE_CACHE = TTLCache(maxsize=1024, ttl=86400)
+
+
+# Selector slots as (field, priority); lower priority wins. These mirror the
+# selector lists the extractor used to run through soup.select_one one by one.
+_TAG_SLOTS = {
+    'title': (('title', 0),),
+    'h1': (('title', 1),),
+    'p': (('content', 6),),
+}
+_CLASS_SLOTS = {
+    'title': (('title', 2),),
+    'post-title': (('title', 3),),
+    'article-title': (('title', 4),),
+    'description': (('content', 2),),
+    'summary': (('content', 3),),
+    'content': (('content', 4),),
+    'article-content': (('content', 5),),
+    'date': (('date', 3),),
+    'publish-date': (('date', 4),),
+    'article-date': (('date', 5),),
+}
+_META_SLOTS = {
+    ('property', 'og:title'): ('title', 5),
+    ('name', 'title'): ('title', 6),
+    ('name', 'description'): ('content', 0),
+    ('property', 'og:description'): ('content', 1),
+    ('property', 'article:published_time'): ('date', 0),
+    ('name', 'date'): ('date', 1),
+}
+
+
+def _scan_candidates(soup):
+    """Walk the document once and keep the first element for each selector slot"""
+    candidates = {'title': {}, 'content': {}, 'date': {}}
+    for element in soup.find_all(True):
+        name = element.name
+        for field, priority in _TAG_SLOTS.get(name, ()):
+            candidates[field].setdefault(priority, element)
+        for css_class in element.get('class') or ():
+            for field, priority in _CLASS_SLOTS.get(css_class, ()):
+                candidates[field].setdefault(priority, element)
+        if name == 'meta':
+            for attr in ('property', 'name'):
+                slot = _META_SLOTS.get((attr, element.get(attr)))
+                if slot:
+                    candidates[slot[0]].setdefault(slot[1], element)
+        elif name == 'time' and element.has_attr('datetime'):
+            candidates['date'].setdefault(2, element)
+    return candidates
+
+
+async def extract_web_metadata(url, use_cache=True):
     """
     Extract metadata from a general web URL.
     
     Args:
         url (str): The web URL
+        use_cache (bool): False to always fetch the full page, neither reading
+            nor filling the metadata and revalidation caches
         
     Returns:
         dict: A dictionary containing web metadata:
@@ -23,6 +90,11 @@ def extract_web_metadata(url):
             - content: The page description (if available)
             - date: The current date
     """
+    if use_cache:
+        cached = _META_CACHE.get(url)
+        if cached is not None:
+            return cached
+    
     result = {
         'source': 'web',
         'title': '',
@@ -31,121 +103,76 @@ def extract_web_metadata(url):
     }
     
     try:
-        # Set headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        # Make request with timeout
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        # Fetch (streamed, size-capped) and parse on the shared client; non-HTML
+        # responses parse as empty so the URL-derived defaults below apply
+        stale = _REVALIDATE_CACHE.get(url) if use_cache else None
+        soup, validators = await fetch_soup(url, validators=stale[0] if stale else None)
+        if soup is None:
+            # 304 Not Modified: the earlier extraction is still current
+            _META_CACHE[url] = stale[1]
+            return stale[1]
         
-        # Parse HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # One walk over the tree records, per field, the first element matching
+        # each selector slot; slots are then tried in priority order below
+        candidates = _scan_candidates(soup)
         
-        # Extract title - try multiple selectors
-        title_selectors = [
-            'title',
-            'h1',
-            '.title',
-            '.post-title',
-            '.article-title',
-            'meta[property="og:title"]',
-            'meta[name="title"]'
-        ]
-        
-        for selector in title_selectors:
-            title_element = soup.select_one(selector)
-            if title_element:
-                if title_element.name == 'meta':
-                    title_text = title_element.get('content', '').strip()
-                else:
-                    title_text = title_element.get_text().strip()
-                
-                if title_text and len(title_text) > 0:
-                    result['title'] = title_text
-                    break
+        # Extract title
+        for priority in sorted(candidates['title']):
+            title_text = element_text(candidates['title'][priority])
+            if title_text:
+                result['title'] = title_text
+                break
         
         # If no title found, create a default one
         if not result['title']:
-            domain = re.sub(r'https?://(www\.)?', '', url).split('/')[0]
+            domain = _DOMAIN_RE.sub('', url).split('/')[0]
             result['title'] = f"Web Content from {domain}"
         
         # Extract description/content
-        content_selectors = [
-            'meta[name="description"]',
-            'meta[property="og:description"]',
-            '.description',
-            '.summary',
-            '.content',
-            '.article-content',
-            'p'
-        ]
-        
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element:
-                if content_element.name == 'meta':
-                    content_text = content_element.get('content', '').strip()
-                else:
-                    content_text = content_element.get_text().strip()
-                
-                if content_text and len(content_text) > 10:
-                    # Limit content length
-                    if len(content_text) > 500:
-                        content_text = content_text[:500] + "..."
-                    result['content'] = content_text
-                    break
+        for priority in sorted(candidates['content']):
+            content_text = element_text(candidates['content'][priority])
+            if content_text and len(content_text) > 10:
+                # Limit content length
+                if len(content_text) > 500:
+                    content_text = content_text[:500] + "..."
+                result['content'] = content_text
+                break
         
         # If no content found, create a default description
         if not result['content']:
             result['content'] = f"Web content from {url}"
         
         # Try to extract publication date
-        date_selectors = [
-            'meta[property="article:published_time"]',
-            'meta[name="date"]',
-            'time[datetime]',
-            '.date',
-            '.publish-date',
-            '.article-date'
-        ]
-        
-        for selector in date_selectors:
-            date_element = soup.select_one(selector)
-            if date_element:
-                if date_element.name == 'meta':
-                    date_text = date_element.get('content', '').strip()
-                elif date_element.name == 'time':
-                    date_text = date_element.get('datetime', '').strip()
-                else:
-                    date_text = date_element.get_text().strip()
-                
-                if date_text:
-                    try:
-                        # Try to parse the date
-                        from dateutil import parser
-                        result['date'] = parser.parse(date_text).replace(tzinfo=timezone.utc)
-                    except:
-                        # If parsing fails, keep the default date
-                        pass
-                    break
+        for priority in sorted(candidates['date']):
+            date_element = candidates['date'][priority]
+            if date_element.name == 'time':
+                date_text = date_element.get('datetime', '').strip()
+            else:
+                date_text = element_text(date_element)
+            
+            if date_text:
+                try:
+                    # Try to parse the date
+                    result['date'] = parse_published_date(date_text)
+                except:
+                    # If parsing fails, keep the default date
+                    pass
+                break
         
-        print(f"Web metadata extracted: {result['title']}")
+        logger.debug("Web metadata extracted: %s", result['title'])
+        if use_cache:
+            _META_CACHE[url] = result
+            if validators['etag'] or validators['last_modified']:
+                _REVALIDATE_CACHE[url] = (validators, result)
         
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching web content: {e}")
-        domain = re.sub(r'https?://(www\.)?', '', url).split('/')[0]
+    except httpx.HTTPError as e:
+        logger.warning("Error fetching web content: %s", e)
+        domain = _DOMAIN_RE.sub('', url).split('/')[0]
         result['title'] = f"Web Content from {domain} (Failed to fetch)"
         result['content'] = f"Failed to fetch web content. URL: {url}"
-    except Exception as e:
-        print(f"Error parsing web content: {e}")
-        domain = re.sub(r'https?://(www\.)?', '', url).split('/')[0]
+    except Exception:
+        logger.exception("Error parsing web content from %s", url)
+        domain = _DOMAIN_RE.sub('', url).split('/')[0]
         result['title'] = f"Web Content from {domain} (Parse error)"
         result['content'] = f"Failed to parse web content. URL: {url}"
     
@@ -162,14 +189,12 @@ def extract_clean_url(text):
     Returns:
         str: Clean URL, or None if not found
     """
-    # Pattern to match http/https URLs
-    url_pattern = r'https?://[^\s]+'
-    match = re.search(url_pattern, text)
+    match = _URL_RE.search(text)
     
     if match:
         url = match.group(0)
         # Remove trailing punctuation
-        url = re.sub(r'[.,;:!?]+$', '', url)
+        url = _TRAIL_PUNCT_RE.sub('', url)
         return url
     
     return None
@@ -1,10 +1,30 @@
 """
 Xiaohongshu (Little Red Book) source detection and metadata extraction module.
 """
+import logging
 import re
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import soupsieve as sv
+from cachetools import TTLCache
 from datetime import datetime, timezone
+from ._fetch import extract_first_match, fetch_soup
+
+logger = logging.getLogger(__name__)
+
+# Selectors compiled once instead of re-parsed by every select_one call
+_TITLE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'title',
+    'h1',
+    '.title',
+    '.post-title',
+    'meta[property="og:title"]',
+))
+
+_XHS_LINK_RE = re.compile(r'https?://[^\s]*(?:xiaohongshu\.com|xhslink\.com)[^\s]*')
+
+# Successful extractions keyed by the extracted link, so the same post pasted
+# with different surrounding text still hits; only used on the event loop thread
+_META_CACHE = TTLCache(maxsize=1024, ttl=3600)
 
 
 def is_xiaohongshu_text(text):
@@ -17,14 +37,10 @@ def is_xiaohongshu_text(text):
     Returns:
         bool: True if the text contains Xiaohongshu content
     """
-    xiaohongshu_patterns = [
-        r'xiaohongshu\.com',
-        r'xhslink\.com',
-        r'小红书',
-        r'xiaohongshu',
-    ]
-    
-    return any(re.search(pattern, text, re.IGNORECASE) for pattern in xiaohongshu_patterns)
+    # 'xiaohongshu' also covers xiaohongshu.com, so plain substring checks
+    # match exactly what the case-insensitive pattern list did
+    lowered = text.lower()
+    return 'xiaohongshu' in lowered or 'xhslink.com' in lowered or '小红书' in text
 
 
 def extract_xiaohongshu_link(text):
@@ -37,9 +53,8 @@ def extract_xiaohongshu_link(text):
     Returns:
         str: The extracted link, or None if not found
     """
-    # Pattern to match Xiaohongshu URLs (including xhslink.com)
-    xiaohongshu_pattern = r'https?://[^\s]*(?:xiaohongshu\.com|xhslink\.com)[^\s]*'
-    match = re.search(xiaohongshu_pattern, text)
+    # Matches Xiaohongshu URLs (including xhslink.com)
+    match = _XHS_LINK_RE.search(text)
     
     if match:
         return match.group(0)
@@ -47,12 +62,14 @@ def extract_xiaohongshu_link(text):
     return None
 
 
-def extract_xiaohongshu_metadata(text):
+async def extract_xiaohongshu_metadata(text, use_cache=True):
     """
     Extract metadata from Xiaohongshu content.
     
     Args:
         text (str): The text containing Xiaohongshu content
+        use_cache (bool): False to always fetch the post, neither reading nor
+            filling the metadata cache
         
     Returns:
         dict: A dictionary containing Xiaohongshu metadata:
@@ -74,46 +91,18 @@ def extract_xiaohongshu_metadata(text):
     # Try to extract link and fetch metadata
     link = extract_xiaohongshu_link(text)
     if link:
+        cached = _META_CACHE.get(link) if use_cache else None
+        if cached is not None:
+            return cached
+        
         # Update the URL to the extracted link
         result['url'] = link
         try:
-            # Set headers to mimic a real browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            # Make request with timeout
-            response = requests.get(link, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse HTML content
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Try to extract title from various selectors
-            title_selectors = [
-                'title',
-                'h1',
-                '.title',
-                '.post-title',
-                'meta[property="og:title"]'
-            ]
+            # Fetch (streamed, size-capped) and parse on the shared client
+            soup, _ = await fetch_soup(link)
             
-            for selector in title_selectors:
-                title_element = soup.select_one(selector)
-                if title_element:
-                    if title_element.name == 'meta':
-                        title_text = title_element.get('content', '').strip()
-                    else:
-                        title_text = title_element.get_text().strip()
-                    
-                    if title_text and title_text not in ['小红书', 'Xiaohongshu']:
-                        result['title'] = title_text
-                        break
+            # Try to extract title from various selectors, skipping the site name
+            result['title'] = extract_first_match(soup, _TITLE_SELECTORS, exclude=('小红书', 'Xiaohongshu'))
             
             # If no title found, create a default one
             if not result['title']:
@@ -122,14 +111,16 @@ def extract_xiaohongshu_metadata(text):
             # Update content to be more descriptive
             result['content'] = f"Xiaohongshu post: {result['title']}"
             
-            print(f"Xiaohongshu metadata extracted: {result['title']}")
+            logger.debug("Xiaohongshu metadata extracted: %s", result['title'])
+            if use_cache:
+                _META_CACHE[link] = result
             
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching Xiaohongshu content: {e}")
+        except httpx.HTTPError as e:
+            logger.warning("Error fetching Xiaohongshu content: %s", e)
             result['title'] = "Xiaohongshu Post (Failed to fetch)"
             result['content'] = f"Failed to fetch Xiaohongshu content. URL: {link}"
-        except Exception as e:
-            print(f"Error parsing Xiaohongshu content: {e}")
+        except Exception:
+            logger.exception("Error parsing Xiaohongshu content from %s", link)
             result['title'] = "Xiaohongshu Post (Parse error)"
             result['content'] = f"Failed to parse Xiaohongshu content. URL: {link}"
     else:
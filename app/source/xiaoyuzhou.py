@@ -1,9 +1,41 @@
 """
 Xiaoyuzhou FM podcast source detection and metadata extraction module.
 """
-import requests
-from bs4 import BeautifulSoup
+import logging
+import httpx
+import soupsieve as sv
 from datetime import datetime, timezone
+from ._fetch import extract_first_match, fetch_soup, parse_published_date, url_host
+
+logger = logging.getLogger(__name__)
+
+# Episode pages carry everything used here in the head and the first detail
+# block, so far less than the general page cap is read
+_MAX_PAGE_BYTES = 256 * 1024
+
+# Selectors compiled once instead of re-parsed by every select_one call
+_TITLE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'h1.episode-title',
+    'h1[class*="title"]',
+    'h1',
+    '.episode-info h1',
+    '.podcast-title',
+    'title',
+))
+_CONTENT_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.episode-description',
+    '.episode-summary',
+    '.podcast-description',
+    '.content',
+    'meta[name="description"]',
+))
+_DATE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.episode-date',
+    '.publish-date',
+    '.date',
+    'time[datetime]',
+    'meta[property="article:published_time"]',
+))
 
 
 def is_xiaoyuzhou_url(url):
@@ -16,10 +48,11 @@ def is_xiaoyuzhou_url(url):
     Returns:
         bool: True if the URL is from Xiaoyuzhou FM
     """
-    return 'xiaoyuzhoufm.com' in url.lower()
+    host = url_host(url)
+    return host == 'xiaoyuzhoufm.com' or host.endswith('.xiaoyuzhoufm.com')
 
 
-def extract_xiaoyuzhou_metadata(url):
+async def extract_xiaoyuzhou_metadata(url):
     """
     Extract metadata from a Xiaoyuzhou FM podcast URL.
     
@@ -42,38 +75,11 @@ def extract_xiaoyuzhou_metadata(url):
     }
     
     try:
-        # Set headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        # Make request with timeout
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Fetch (streamed, size-capped) and parse on the shared client
+        soup, _ = await fetch_soup(url, max_bytes=_MAX_PAGE_BYTES)
         
         # Extract title - try multiple selectors
-        title_selectors = [
-            'h1.episode-title',
-            'h1[class*="title"]',
-            'h1',
-            '.episode-info h1',
-            '.podcast-title',
-            'title'
-        ]
-        
-        for selector in title_selectors:
-            title_element = soup.select_one(selector)
-            if title_element and title_element.get_text().strip():
-                result['title'] = title_element.get_text().strip()
-                break
+        result['title'] = extract_first_match(soup, _TITLE_SELECTORS)
         
         # If no title found, create a default one
         if not result['title']:
@@ -81,41 +87,15 @@ def extract_xiaoyuzhou_metadata(url):
             result['title'] = f"Xiaoyuzhou FM Podcast Episode: {episode_id}"
         
         # Extract description/content
-        content_selectors = [
-            '.episode-description',
-            '.episode-summary',
-            '.podcast-description',
-            '.content',
-            'meta[name="description"]'
-        ]
-        
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element:
-                if content_element.name == 'meta':
-                    content_text = content_element.get('content', '').strip()
-                else:
-                    content_text = content_element.get_text().strip()
-                
-                if content_text:
-                    result['content'] = content_text
-                    break
+        result['content'] = extract_first_match(soup, _CONTENT_SELECTORS)
         
         # If no content found, create a default description
         if not result['content']:
             result['content'] = f"Podcast episode from Xiaoyuzhou FM. URL: {url}"
         
         # Try to extract publication date
-        date_selectors = [
-            '.episode-date',
-            '.publish-date',
-            '.date',
-            'time[datetime]',
-            'meta[property="article:published_time"]'
-        ]
-        
-        for selector in date_selectors:
-            date_element = soup.select_one(selector)
+        for selector in _DATE_SELECTORS:
+            date_element = selector.select_one(soup)
             if date_element:
                 if date_element.name == 'meta':
                     date_text = date_element.get('content', '').strip()
@@ -127,21 +107,20 @@ def extract_xiaoyuzhou_metadata(url):
                 if date_text:
                     try:
                         # Try to parse the date
-                        from dateutil import parser
-                        result['date'] = parser.parse(date_text).replace(tzinfo=timezone.utc)
+                        result['date'] = parse_published_date(date_text)
                     except:
                         # If parsing fails, keep the default date
                         pass
                     break
         
-        print(f"Xiaoyuzhou FM metadata extracted: {result['title']}")
+        logger.debug("Xiaoyuzhou FM metadata extracted: %s", result['title'])
         
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching Xiaoyuzhou FM content: {e}")
+    except httpx.HTTPError as e:
+        logger.warning("Error fetching Xiaoyuzhou FM content: %s", e)
         result['title'] = f"Xiaoyuzhou FM Podcast (Failed to fetch: {str(e)})"
         result['content'] = f"Failed to fetch podcast metadata. URL: {url}"
     except Exception as e:
-        print(f"Error parsing Xiaoyuzhou FM content: {e}")
+        logger.exception("Error parsing Xiaoyuzhou FM content from %s", url)
         result['title'] = f"Xiaoyuzhou FM Podcast (Parse error: {str(e)})"
         result['content'] = f"Failed to parse podcast metadata. URL: {url}"
     
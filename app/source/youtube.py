@@ -1,9 +1,31 @@
 """
 YouTube source detection and metadata extraction module.
 """
+import asyncio
+import logging
 import re
-import yt_dlp
+import threading
+import orjson
+from cachetools import TTLCache
 from datetime import datetime, timezone
+from ._fetch import client, fetch_html, parse_published_date
+
+logger = logging.getLogger(__name__)
+
+_YT_PATH = r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/|youtube\.com/shorts/)'
+_YT_URL_RE = re.compile(_YT_PATH, re.IGNORECASE)
+_YT_ID_RE = re.compile(_YT_PATH + r'([a-zA-Z0-9_-]{11})')
+_YT_CLEAN_RE = re.compile(r'https?://(?:www\.)?' + _YT_ID_RE.pattern)
+
+_OEMBED_URL = 'https://www.youtube.com/oembed'
+# JSON string fields embedded in the watch page's ytInitialPlayerResponse
+_DESCRIPTION_RE = re.compile(rb'"shortDescription":"((?:[^"\\]|\\.)*)"')
+_UPLOAD_DATE_RE = re.compile(rb'"uploadDate":"([^"]+)"')
+
+# Successful extractions by video id; yt-dlp costs several round-trips per video.
+# Extraction runs in worker threads, hence the lock
+_META_CACHE = TTLCache(maxsize=512, ttl=3600)
+_META_CACHE_LOCK = threading.Lock()
 
 
 def is_youtube_url(url):
@@ -16,15 +38,7 @@ def is_youtube_url(url):
     Returns:
         bool: True if the URL is from YouTube
     """
-    youtube_patterns = [
-        r'youtube\.com/watch\?v=',
-        r'youtu\.be/',
-        r'youtube\.com/embed/',
-        r'youtube\.com/v/',
-        r'youtube\.com/shorts/',
-    ]
-    
-    return any(re.search(pattern, url, re.IGNORECASE) for pattern in youtube_patterns)
+    return _YT_URL_RE.search(url) is not None
 
 
 def extract_youtube_video_id(url):
@@ -37,24 +51,57 @@ def extract_youtube_video_id(url):
     Returns:
         str: The video ID, or None if not found
     """
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/|youtube\.com/shorts/)([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _YT_ID_RE.search(url)
+    if match:
+        return match.group(1)
     
     return None
 
 
-def extract_youtube_metadata(url):
+# Primary yt-dlp options, for metadata only
+_YDL_OPTS_PRIMARY = {
+    'quiet': True,
+    'no_warnings': True,
+    'ignoreerrors': True,  # Ignore format errors
+    'no_check_certificate': True,  # Skip certificate verification
+    'extractor_retries': 3,  # Retry extraction up to 3 times
+    'writethumbnail': False,  # Don't write thumbnail
+    'writeinfojson': False,  # Don't write info json
+    'skip_download': True,  # Skip downloading any files
+    # Metadata only: no format selection and no DASH/HLS manifest fetches
+    'youtube_include_dash_manifest': False,
+    'youtube_include_hls_manifest': False,
+    'extract_flat': 'in_playlist',
+    'prefer_insecure': False,  # Use HTTPS when possible
+    'socket_timeout': 10,
+}
+_YDL = None
+_YDL_LOCK = threading.Lock()
+
+
+def _primary_ydl():
+    """The shared primary YoutubeDL, built on first use (call with _YDL_LOCK held)"""
+    global _YDL
+    if _YDL is None:
+        import yt_dlp
+        _YDL = yt_dlp.YoutubeDL(_YDL_OPTS_PRIMARY)
+    return _YDL
+
+
+def _cache_metadata(video_id, result):
+    """Remember a successful extraction for this video"""
+    with _META_CACHE_LOCK:
+        _META_CACHE[video_id] = result
+
+
+def extract_youtube_metadata(url, use_cache=True):
     """
     Extract metadata from a YouTube URL using yt-dlp.
     
     Args:
         url (str): The YouTube URL
+        use_cache (bool): False to always extract afresh, neither reading nor
+            filling the metadata cache
         
     Returns:
         dict: A dictionary containing YouTube metadata:
@@ -75,64 +122,62 @@ def extract_youtube_metadata(url):
         result['title'] = f"YouTube Video: {video_id or 'Unknown'} +++++ Unknown Channel"
         return result
     
+    if use_cache:
+        with _META_CACHE_LOCK:
+            cached = _META_CACHE.get(video_id)
+        if cached is not None:
+            return cached
+    
+    # yt-dlp is only the fallback behind extract_youtube_metadata_fast and is
+    # slow to import, so workers load it on the first video that needs it
+    import yt_dlp
+    
     try:
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'ignoreerrors': True,  # Ignore format errors
-            'no_check_certificate': True,  # Skip certificate verification
-            'extractor_retries': 3,  # Retry extraction up to 3 times
-            'writethumbnail': False,  # Don't write thumbnail
-            'writeinfojson': False,  # Don't write info json
-            'skip_download': True,  # Skip downloading any files
-            'format': 'best[height<=720]',  # Prefer formats with height <= 720p
-            'prefer_insecure': False,  # Use HTTPS when possible
-            'socket_timeout': 30,  # Increase timeout
-        }
+        # One shared YoutubeDL; building it loads every extractor, and it is
+        # not thread-safe, so calls from the worker threads take turns
+        with _YDL_LOCK:
+            info = _primary_ydl().extract_info(url, download=False)
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            if info:
-                # Extract title
-                title = info.get('title', '')
-                if title:
-                    result['title'] = title
-                else:
-                    result['title'] = f"YouTube Video: {video_id}"
-                
-                # Extract channel name
-                channel = info.get('uploader', '')
-                if channel:
-                    result['content'] = f"Channel: {channel}"
-                
-                # Extract description
-                description = info.get('description', '')
-                if description:
-                    # Limit description length
-                    if len(description) > 500:
-                        description = description[:500] + "..."
-                    result['content'] = f"Channel: {channel}\n\nDescription: {description}" if channel else f"Description: {description}"
-                
-                # Extract upload date
-                upload_date = info.get('upload_date')
-                if upload_date:
-                    try:
-                        # Convert YYYYMMDD format to datetime
-                        date_obj = datetime.strptime(upload_date, '%Y%m%d')
-                        result['date'] = date_obj.replace(tzinfo=timezone.utc)
-                    except:
-                        pass
-                
-                print(f"YouTube metadata extracted: {result['title']}")
+        if info:
+            # Extract title
+            title = info.get('title', '')
+            if title:
+                result['title'] = title
             else:
-                result['title'] = f"YouTube Video: {video_id} +++++ Unknown Channel"
-                result['content'] = f"Failed to extract metadata for YouTube video: {url}"
-                
+                result['title'] = f"YouTube Video: {video_id}"
+            
+            # Extract channel name
+            channel = info.get('uploader', '')
+            if channel:
+                result['content'] = f"Channel: {channel}"
+            
+            # Extract description
+            description = info.get('description', '')
+            if description:
+                # Limit description length
+                if len(description) > 500:
+                    description = description[:500] + "..."
+                result['content'] = f"Channel: {channel}\n\nDescription: {description}" if channel else f"Description: {description}"
+            
+            # Extract upload date
+            upload_date = info.get('upload_date')
+            if upload_date and len(upload_date) == 8 and upload_date.isdigit():
+                try:
+                    # YYYYMMDD; slicing skips strptime's format interpretation
+                    result['date'] = datetime(int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:]), tzinfo=timezone.utc)
+                except ValueError:
+                    pass
+            
+            logger.debug("YouTube metadata extracted: %s", result['title'])
+            if use_cache:
+                _cache_metadata(video_id, result)
+        else:
+            result['title'] = f"YouTube Video: {video_id} +++++ Unknown Channel"
+            result['content'] = f"Failed to extract metadata for YouTube video: {url}"
+            
     except Exception as e:
         error_msg = str(e)
-        print(f"Error extracting YouTube metadata: {error_msg}")
+        logger.warning("Error extracting YouTube metadata: %s", error_msg)
         
         # Try to extract basic info even if detailed extraction fails
         result['title'] = f"YouTube Video: {video_id}"
@@ -141,7 +186,7 @@ def extract_youtube_metadata(url):
         # If it's a format error, try with more lenient options
         if any(keyword in error_msg.lower() for keyword in ["format", "not available", "requested format", "unavailable"]):
             try:
-                print(f"Retrying with lenient options for video: {video_id}")
+                logger.debug("Retrying with lenient options for video: %s", video_id)
                 ydl_opts_fallback = {
                     'quiet': True,
                     'no_warnings': True,
@@ -156,13 +201,15 @@ def extract_youtube_metadata(url):
                     if info and info.get('title'):
                         result['title'] = info.get('title', f"YouTube Video: {video_id}")
                         result['content'] = f"Channel: {info.get('uploader', 'Unknown')}"
-                        print(f"Fallback extraction successful: {result['title']}")
+                        logger.debug("Fallback extraction successful: %s", result['title'])
+                        if use_cache:
+                            _cache_metadata(video_id, result)
                         return result  # Return early on successful fallback
             except Exception as fallback_error:
-                print(f"Fallback extraction also failed: {fallback_error}")
+                logger.warning("Fallback extraction also failed: %s", fallback_error)
                 # Try one more time with the most basic extraction
                 try:
-                    print(f"Trying basic extraction for video: {video_id}")
+                    logger.debug("Trying basic extraction for video: %s", video_id)
                     ydl_opts_basic = {
                         'quiet': True,
                         'no_warnings': True,
@@ -178,10 +225,12 @@ def extract_youtube_metadata(url):
                         if info:
                             result['title'] = info.get('title', f"YouTube Video: {video_id}")
                             result['content'] = f"Channel: {info.get('uploader', 'Unknown')}"
-                            print(f"Basic extraction successful: {result['title']}")
+                            logger.debug("Basic extraction successful: %s", result['title'])
+                            if use_cache:
+                                _cache_metadata(video_id, result)
                             return result
                 except Exception as basic_error:
-                    print(f"Basic extraction also failed: {basic_error}")
+                    logger.warning("Basic extraction also failed: %s", basic_error)
                 
                 result['content'] = f"Channel: Unknown\n\nError: {error_msg}\nFallback failed: {str(fallback_error)}"
         else:
@@ -191,6 +240,80 @@ def extract_youtube_metadata(url):
     return result
 
 
+
+async def extract_youtube_metadata_fast(url, use_cache=True):
+    """
+    Extract YouTube metadata without yt-dlp.
+    
+    Title and channel come from the oEmbed endpoint; description and upload
+    date are read from the watch page, fetched concurrently. Both go through
+    the shared async client.
+    
+    Args:
+        url (str): The YouTube URL
+        use_cache (bool): False to always extract afresh, neither reading nor
+            filling the metadata cache
+        
+    Returns:
+        dict: The same fields as extract_youtube_metadata, or None when oEmbed
+            fails and the caller should fall back to yt-dlp
+    """
+    video_id = extract_youtube_video_id(url)
+    if not video_id:
+        return None
+    
+    if use_cache:
+        with _META_CACHE_LOCK:
+            cached = _META_CACHE.get(video_id)
+        if cached is not None:
+            return cached
+    
+    watch_url = f"https://www.youtube.com/watch?v={video_id}"
+    oembed, page = await asyncio.gather(
+        client.get(_OEMBED_URL, params={'url': watch_url, 'format': 'json'}, timeout=5),
+        fetch_html(watch_url),
+        return_exceptions=True
+    )
+    if isinstance(oembed, Exception) or oembed.status_code != 200:
+        return None
+    try:
+        data = orjson.loads(oembed.content)
+    except ValueError:
+        return None
+    
+    result = {
+        'source': 'youtube',
+        'title': data.get('title') or f"YouTube Video: {video_id}",
+        'content': '',
+        'date': datetime.now(timezone.utc),
+    }
+    channel = data.get('author_name', '')
+    if channel:
+        result['content'] = f"Channel: {channel}"
+    
+    body = b'' if isinstance(page, Exception) else page[0]
+    description_match = _DESCRIPTION_RE.search(body) if body else None
+    if description_match:
+        try:
+            description = orjson.loads(b'"' + description_match.group(1) + b'"')
+        except ValueError:
+            description = ''
+        if description:
+            # Limit description length
+            if len(description) > 500:
+                description = description[:500] + "..."
+            result['content'] = f"Channel: {channel}\n\nDescription: {description}" if channel else f"Description: {description}"
+    date_match = _UPLOAD_DATE_RE.search(body) if body else None
+    if date_match:
+        try:
+            result['date'] = parse_published_date(date_match.group(1).decode())
+        except ValueError:
+            pass
+    
+    if use_cache:
+        _cache_metadata(video_id, result)
+    return result
+
 def extract_clean_youtube_url(text):
     """
     Extract a clean YouTube URL from text.
@@ -201,9 +324,7 @@ def extract_clean_youtube_url(text):
     Returns:
         str: Clean YouTube URL, or None if not found
     """
-    # Pattern to match YouTube URLs
-    youtube_pattern = r'https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/|youtube\.com/shorts/)([a-zA-Z0-9_-]{11})'
-    match = re.search(youtube_pattern, text)
+    match = _YT_CLEAN_RE.search(text)
     
     if match:
         video_id = match.group(1)
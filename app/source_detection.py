@@ -2,12 +2,16 @@
 Standalone source detection module for FastAPI application.
 This module provides comprehensive metadata extraction from various sources including YouTube, Xiaohongshu, Xiaoyuzhou FM, and general web content.
 """
+import asyncio
+import logging
+import re
 from datetime import datetime, timezone
 from typing import Dict, Optional
-from .config import is_render
+from .config import system_config
 from .source import (
     is_youtube_url,
     extract_youtube_metadata,
+    extract_youtube_metadata_fast,
     extract_clean_youtube_url,
     is_xiaohongshu_text,
     extract_xiaohongshu_metadata,
@@ -17,13 +21,49 @@ from .source import (
     extract_clean_url
 )
 
+logger = logging.getLogger(__name__)
 
-def detect_source(url: str) -> Dict:
+
+async def _extract_youtube_metadata(url: str, use_cache: bool = True) -> Dict:
+    """oEmbed + watch page first; yt-dlp (blocking, slow) only as fallback"""
+    data = await extract_youtube_metadata_fast(url, use_cache=use_cache)
+    if data is None:
+        data = await asyncio.to_thread(extract_youtube_metadata, url, use_cache)
+    return data
+
+
+async def _extract_xiaoyuzhou_metadata(url: str, use_cache: bool = True) -> Dict:
+    """Xiaoyuzhou episodes are not cached, so there is nothing to bypass"""
+    return await extract_xiaoyuzhou_metadata(url)
+
+
+# Anything without a scheme, www. or a domain-and-path is treated as plain text
+_LOOKS_LIKE_URL = re.compile(r'https?://|www\.|[\w-]+\.[a-z]{2,}/', re.IGNORECASE)
+
+# Detections in flight across all batches, so concurrent batch runs share one
+# bound and stay under the shared client's connection limit
+_BATCH_SLOTS = asyncio.Semaphore(16)
+
+# Source checks, each paired with its extractor. Cheapest first: the Xiaoyuzhou
+# host check is memoized, and the Xiaohongshu check lower-cases and scans the
+# whole text, so it goes last; the sources' URLs do not overlap
+_DISPATCHERS = (
+    (is_youtube_url, _extract_youtube_metadata),
+    (is_xiaoyuzhou_url, _extract_xiaoyuzhou_metadata),
+    (is_xiaohongshu_text, extract_xiaohongshu_metadata),
+)
+
+
+async def detect_source(url: str, use_cache: bool = True) -> Dict:
     """
     Detect the source type of a given URL and extract relevant metadata.
+    Pages are fetched on the shared async client; the yt-dlp fallback for
+    YouTube is blocking and runs in a thread.
     
     Args:
         url (str): The URL or text to analyze
+        use_cache (bool): False to fetch fresh metadata instead of reusing the
+            extractors' cached results, as refreshes of stored entries need
         
     Returns:
         dict: A dictionary containing metadata about the URL:
@@ -48,6 +88,12 @@ def detect_source(url: str) -> Dict:
             'url': url,  # Default to original URL
         }
         
+        # Plain text (no link at all) skips URL cleanup, dispatch and any fetch;
+        # Xiaohongshu share text without a link still goes to its extractor
+        if not _LOOKS_LIKE_URL.search(url) and not is_xiaohongshu_text(url):
+            result.update(source='text', tag='note', title="Text Content", content=url)
+            return result
+        
         # STEP 1: Extract the correct URL from the input string
         final_url = url
         
@@ -56,7 +102,7 @@ def detect_source(url: str) -> Dict:
         if clean_url:
             final_url = clean_url
             result['url'] = final_url
-            print(f"Extracted clean URL: {url} -> {final_url}")
+            logger.debug("Extracted clean URL: %s -> %s", url, final_url)
         
         # Try to extract YouTube URL if it's a YouTube link
         if is_youtube_url(url):
@@ -64,67 +110,43 @@ def detect_source(url: str) -> Dict:
             if youtube_url:
                 final_url = youtube_url
                 result['url'] = final_url
-                print(f"Extracted YouTube URL: {url} -> {final_url}")
+                logger.debug("Extracted YouTube URL: %s -> %s", url, final_url)
         
         # Check if running on Render - skip metadata extraction if so
-        if is_render():
-            print("Running on Render - skipping metadata extraction, saving URL only")
+        if system_config.is_render:
+            logger.debug("Running on Render - skipping metadata extraction, saving URL only")
             result['url'] = final_url
             result['title'] = f"Entry from {final_url}"
             result['content'] = f"URL saved from Render: {final_url}"
             return result
         
-        # STEP 2: Extract metadata based on the final URL
-        # Check if URL contains Xiaohongshu link
-        if is_xiaohongshu_text(final_url):
-            xiaohongshu_data = extract_xiaohongshu_metadata(final_url)
-            if xiaohongshu_data:
-                result.update({
-                    'title': xiaohongshu_data.get('title', ''),
-                    'content': xiaohongshu_data.get('content', ''),
-                    'url': xiaohongshu_data.get('url', final_url)
-                })
-        
-        # Check if URL is from YouTube
-        elif is_youtube_url(final_url):
-            youtube_data = extract_youtube_metadata(final_url)
-            if youtube_data:
-                result.update({
-                    'title': youtube_data.get('title', ''),
-                    'content': youtube_data.get('content', ''),
-                    'url': final_url
-                })
-        
-        # Check if URL is from Xiaoyuzhou FM
-        elif is_xiaoyuzhou_url(final_url):
-            xiaoyuzhou_data = extract_xiaoyuzhou_metadata(final_url)
-            if xiaoyuzhou_data:
-                result.update({
-                    'title': xiaoyuzhou_data.get('title', ''),
-                    'content': xiaoyuzhou_data.get('content', ''),
-                    'url': final_url
-                })
+        # STEP 2: Extract metadata with the first extractor whose check matches
+        # the final URL; anything unrecognised is treated as a web page
+        for matches, extract in _DISPATCHERS:
+            if matches(final_url):
+                break
+        else:
+            extract = extract_web_metadata
         
-        # For all other URLs, try to extract web metadata
+        data = await extract(final_url, use_cache=use_cache)
+        if data:
+            result.update({
+                'title': data.get('title', ''),
+                'content': data.get('content', ''),
+                # Xiaohongshu narrows pasted text down to the post link
+                'url': data.get('url', final_url)
+            })
         else:
-            web_data = extract_web_metadata(final_url)
-            if web_data:
-                result.update({
-                    'title': web_data.get('title', ''),
-                    'content': web_data.get('content', ''),
-                    'url': final_url
-                })
-            else:
-                # If no URL found, treat as text content
-                result['title'] = "Text Content"
-                result['content'] = url
-                result['source'] = 'text'
-                result['tag'] = 'note'
+            # If no URL found, treat as text content
+            result['title'] = "Text Content"
+            result['content'] = url
+            result['source'] = 'text'
+            result['tag'] = 'note'
         
         return result
         
     except Exception as e:
-        print(f"Error in detect_source: {e}")
+        logger.exception("Error in detect_source for %s", url)
         return {
             'success': False,
             'source': 'unknown',
@@ -135,3 +157,22 @@ def detect_source(url: str) -> Dict:
             'url': url,
             'error': str(e)
         }
+
+
+async def detect_sources_batch(urls, use_cache: bool = True) -> list:
+    """
+    Run detect_source over many URLs concurrently.
+    
+    Args:
+        urls: The URLs or texts to analyze
+        use_cache (bool): Passed on to detect_source
+        
+    Returns:
+        list: One result per URL, in order; an exception instance where a
+            detection raised
+    """
+    async def bounded(url):
+        async with _BATCH_SLOTS:
+            return await detect_source(url, use_cache=use_cache)
+    
+    return await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
@@ -0,0 +1,17 @@
+"""
+Shared Jinja2 templates for the pages and routers.
+One environment means one compiled-template cache for the whole process.
+"""
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from .config import get_config
+
+templates = Jinja2Templates(directory="templates")
+
+# Compiled template bytecode is kept on disk (in the system temp dir), so new
+# workers and restarts skip recompiling; only local development checks the
+# template files for edits on every render
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = get_config().get('auto_reload', False)
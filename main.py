@@ -10,27 +10,34 @@ Supports three deployment environments:
 
 from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import uvicorn
+import anyio.to_thread
+import asyncio
 import os
 import sys
 import subprocess
+import threading
 import logging
+import queue
+from contextlib import asynccontextmanager
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Import routers
 from app.routers import stocks, information, notes, api, settings, auth, environment
-from app.database import engine, get_db
+from app.database import get_engine, get_pool_options, dispose_engine, get_db
 from app import models
 from app.config import (
     system_config, is_local, is_mirror, is_render, 
     requires_auth, get_environment_info, get_config
 )
-from app.auth import require_auth
+from app.auth import require_auth, warm_up_auth, SECRET_KEY
+from app.templating import templates
+from app.source._fetch import close_client
 
 # Configure logging
 def setup_logging():
@@ -63,9 +70,12 @@ def setup_logging():
     )
     file_handler.setFormatter(file_formatter)
     
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Records are queued on the calling thread and written by a listener
+    # thread, so request handlers never wait on file I/O or rotation
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
     
     # Also configure uvicorn logger
     uvicorn_logger = logging.getLogger("uvicorn")
@@ -80,12 +90,15 @@ def setup_logging():
     )
     access_handler.setLevel(logging.INFO)
     access_handler.setFormatter(file_formatter)
-    uvicorn_access_logger.addHandler(access_handler)
+    access_queue = queue.Queue(-1)
+    uvicorn_access_logger.addHandler(QueueHandler(access_queue))
+    access_listener = QueueListener(access_queue, access_handler, respect_handler_level=True)
+    access_listener.start()
     
-    return logger
+    return logger, (listener, access_listener)
 
 # Setup logging
-logger = setup_logging()
+logger, log_listeners = setup_logging()
 
 # Print environment information
 logger.info("="*80)
@@ -99,37 +112,93 @@ logger.info(f"Access: {system_config.config.get('access')}")
 logger.info(f"Debug Mode: {system_config.config.get('debug')}")
 logger.info("="*80)
 
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown work for each worker process"""
+    # Sync (def) routes run on anyio's worker threads and nearly all of them
+    # hold a pooled connection; size the limiter to the pool plus a little
+    # headroom for routes that do not, so excess requests queue here instead
+    # of parking threads in the pool until its timeout
+    pool = get_pool_options()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(
+        os.getenv("DOOR_THREADPOOL_SIZE", pool["pool_size"] + pool["max_overflow"] + 10)
+    )
+    
+    # Make sure the engine exists and the session factory is bound to it
+    engine = get_engine()
+    
+    # Create database tables; a pre-start step can run this once and set
+    # DOOR_INIT_DB=0 so the workers skip the round trips
+    if os.getenv("DOOR_INIT_DB", "1") == "1":
+        await asyncio.to_thread(models.Base.metadata.create_all, engine)
+    
+    # The information page reads its generation sequence on every load, so it
+    # is created even when the workers skip create_all
+    await asyncio.to_thread(models.create_page_generation, engine)
+    
+    # Warm up password hashing and JWT crypto so the first login is not slow;
+    # run in a thread so the hashing does not block event loop startup
+    if system_config.requires_auth:
+        await asyncio.to_thread(warm_up_auth)
+    
+    yield
+    
+    # Close pooled connections and the shared source-fetching HTTP client
+    dispose_engine()
+    await close_client()
+    # Write out queued log records and stop the log listener threads
+    for listener in app.state.log_listeners:
+        listener.stop()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Door - Stock & Information Manager",
     description="A modern web application for managing stocks, information, and notes",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress HTML/JSON responses; small bodies are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+# Starlette compares origins as exact strings, so the old "https://*.onrender.com"
+# entry matched nothing; on Render allow the service's own public URL (set by
+# the platform), elsewhere any origin
+if is_render():
+    _CORS_ORIGINS = [url for url in (os.getenv("RENDER_EXTERNAL_URL"),) if url]
+else:
+    _CORS_ORIGINS = ["*"]
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if not is_render() else ["https://*.onrender.com"],
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Exactly what the routers and front-end send, rather than wildcards that
+    # make every preflight echo the requested methods/headers back
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
+# Keep the log listeners reachable so shutdown can flush them
+app.state.log_listeners = log_listeners
+
 # Add session middleware if authentication is required
-if requires_auth():
+if system_config.requires_auth:
+    # Sign session cookies with the key auth already resolved at import, so
+    # an unset SECRET_KEY falls back to the persisted key, not a constant
     app.add_middleware(
         SessionMiddleware, 
-        secret_key=os.getenv("SECRET_KEY", "change-this-secret-key")
+        secret_key=SECRET_KEY,
+        https_only=is_render()
     )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-# Setup templates
-templates = Jinja2Templates(directory="templates")
+# Mount static files. Where a front proxy serves /static/ straight from disk
+# (e.g. nginx: location /static/ { alias <repo>/static/; sendfile on; }),
+# set DOOR_SERVE_STATIC=0 so those requests never reach Python
+if os.getenv("DOOR_SERVE_STATIC", "1") == "1":
+    app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -140,18 +209,19 @@ app.include_router(information.router, prefix="/information", tags=["information
 app.include_router(notes.router, prefix="/notes", tags=["notes"])
 app.include_router(settings.router, prefix="/settings", tags=["settings"])
 
-@app.get("/", response_class=HTMLResponse)
-async def home(request: Request, user: dict = Depends(require_auth) if requires_auth() else None):
-    """Home page with dashboard overview"""
-    # If authentication is required and user is not authenticated, redirect to login
-    if requires_auth() and user is None:
-        return RedirectResponse(url="/auth/login", status_code=302)
-    
-    context = {"request": request}
-    if user:
-        context["user"] = user
-    
-    return templates.TemplateResponse("index.html", context)
+if system_config.requires_auth:
+    @app.get("/", response_class=HTMLResponse)
+    async def home(request: Request, user: dict = Depends(require_auth)):
+        """Home page with dashboard overview"""
+        # Not logged in: send to the login page
+        if user is None:
+            return RedirectResponse(url="/auth/login", status_code=302)
+        return templates.TemplateResponse("index.html", {"request": request, "user": user})
+else:
+    @app.get("/", response_class=HTMLResponse)
+    async def home(request: Request):
+        """Home page with dashboard overview"""
+        return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/health")
 async def health_check():
@@ -182,32 +252,64 @@ def run_database_sync():
             logger.warning("⚠️  Database sync script not found, skipping...")
             return
         
-        # Run the sync script with smart-sync mode
-        result = subprocess.run(
+        # Run the sync script with smart-sync mode, logging its output as it
+        # arrives instead of buffering all of it until the script exits
+        proc = subprocess.Popen(
             [sys.executable, str(sync_script), "--direction", "smart-sync"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300  # 5 minute timeout
+            bufsize=1
         )
         
-        if result.returncode == 0:
+        # Reading the pipe blocks until the script exits, so a timer enforces
+        # the 5 minute timeout by killing it
+        timed_out = threading.Event()
+        def kill_sync():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(300, kill_sync)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                logger.info(line.rstrip())
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        if timed_out.is_set():
+            logger.warning("⚠️  Database sync timed out, continuing with startup...")
+        elif returncode == 0:
             logger.info("✅ Database sync completed successfully")
-            if result.stdout:
-                logger.info(result.stdout)
         else:
             logger.warning("⚠️  Database sync failed, but continuing with startup...")
-            if result.stderr:
-                logger.error(f"Error: {result.stderr}")
             
-    except subprocess.TimeoutExpired:
-        logger.warning("⚠️  Database sync timed out, continuing with startup...")
     except Exception as e:
         logger.error(f"⚠️  Error running database sync: {e}")
         logger.info("Continuing with application startup...")
     
     logger.info("="*60)
 
-if __name__ == "__main__":
+# uvloop event loop and httptools parser (both from uvicorn[standard]); named
+# explicitly so a deploy without them fails at startup instead of silently
+# falling back. uvloop has no Windows build.
+SERVER_IMPLEMENTATION = {
+    "loop": "asyncio" if sys.platform == "win32" else "uvloop",
+    "http": "httptools",
+}
+
+def worker_count(config):
+    """
+    Number of uvicorn worker processes: WEB_CONCURRENCY if set, else 1.
+    
+    Only raise it deliberately. Every worker opens its own database pool,
+    runs its own argon2 hashing and keeps its own metadata and token caches.
+    """
+    return int(os.getenv("WEB_CONCURRENCY") or config.get('workers', 1))
+
+def serve():
+    """Start uvicorn with the detected environment's configuration"""
     # Run database sync before starting the server (local only)
     run_database_sync()
     
@@ -216,16 +318,29 @@ if __name__ == "__main__":
     port = config.get('port', 8080)
     host = config.get('host', '0.0.0.0')
     auto_reload = config.get('auto_reload', False)
+    # The reloader runs a single process, so workers only apply without it
+    workers = 1 if auto_reload else worker_count(config)
     
     logger.info(f"Starting uvicorn server on {host}:{port}")
     logger.info(f"Auto-reload: {auto_reload}")
+    logger.info(f"Workers: {workers}")
     logger.info("="*80)
     
+    # The reloader and worker processes import the app from its import string;
+    # a single in-process server takes this module's app directly, since run
+    # as a script this file is __main__ and "main:app" would import it again
+    target = "main:app" if auto_reload or workers > 1 else app
+    
     # Start server with environment-specific configuration
     uvicorn.run(
-        "main:app",
+        target,
         host=host,
         port=port,
         reload=auto_reload,
-        log_level="info"
+        workers=workers,
+        log_level="info",
+        **SERVER_IMPLEMENTATION
     )
+
+if __name__ == "__main__":
+    serve()
@@ -11,25 +11,18 @@ The application will automatically detect if it's running on:
 This file is kept for backward compatibility with existing Render configuration.
 """
 
-# Import everything from main module
-from main import *
+import logging
+
+# Import only what the wrapper uses; app stays importable as main_render:app
+from main import app, serve
+
+__all__ = ["app"]
 
 if __name__ == "__main__":
-    import logging
     logger = logging.getLogger(__name__)
     logger.info("🔵 Starting in RENDER mode (via main_render.py compatibility wrapper)")
     logger.info("💡 TIP: You can now use 'main.py' directly - it auto-detects environments!")
     
-    # Get configuration
-    config = get_config()
-    port = config.get('port', int(os.environ.get("PORT", 10000)))
-    host = config.get('host', '0.0.0.0')
-    
-    # Render deployment configuration
-    uvicorn.run(
-        "main:app",  # Use main.app for consistency
-        host=host,
-        port=port,
-        reload=False,  # Always disable reload in production
-        log_level="info"
-    )
+    # Same startup path as main.py; running this file is itself one of the
+    # Render detection signals, so the Render configuration applies
+    serve()